@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Benchmark unpack, pack, validate and editing on generated documents.
+
+Each stage is timed on synthetic documents (see corpus.py) at several sizes.
+The report shows how each stage scales between sizes, and the run fails if
+a stage grows faster than allowed or is slower than a stored baseline.
+
+Example usage:
+    python benchmark.py --save baseline.json
+    python benchmark.py --baseline baseline.json
+    python benchmark.py --sizes 500,2000,8000 --repeat 5 --stages docx.validate
+
+Sizes are docx paragraphs; pptx decks get one slide per 20 paragraphs. The
+XSD error cache is turned off so validation does its full work every time.
+
+Stages:
+    docx.unpack, docx.pack, docx.validate: unpack.py, pack.py (without the
+        soffice check) and validate.py on a document with tracked changes,
+        comments and images
+    docx.editor_load, docx.get_node: parsing document.xml into an XMLEditor
+        and looking up nodes by line number, attributes and text
+    docx.session: a Document session that deletes runs, inserts a
+        paragraph, adds comments and saves with validation
+    pptx.unpack, pptx.pack, pptx.validate: as above, for presentations
+
+The editing stages need the docx skill's scripts and are skipped where they
+are not available.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import math
+import os
+import platform
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import build_docx, build_pptx
+from pack import pack_document
+from validation import (
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# The docx skill's editing library lives next to the ooxml directory
+sys.path.insert(0, str(SCRIPTS_DIR.parents[1]))
+try:
+    from scripts.document import Document
+    from scripts.utilities import XMLEditor
+except ImportError:
+    Document = XMLEditor = None
+
+DEFAULT_SIZES = (200, 1000, 5000)
+
+# Stages whose time grows with size by more than size ** MAX_EXPONENT fail
+MAX_EXPONENT = 1.3
+
+# Fraction by which a stage may exceed its baseline time
+TOLERANCE = 0.25
+
+# Timings below this many seconds are too noisy to judge
+NOISE_FLOOR = 0.01
+
+
+class Corpus:
+    """Generated documents for one size, unpacked once and copied per stage."""
+
+    def __init__(self, root, size):
+        self.root = Path(root)
+        self.size = size
+        self.docx = build_docx(
+            self.root / "doc.docx",
+            paragraphs=size,
+            tracked_changes=max(1, size // 10),
+            comments=max(1, size // 20),
+            media=max(1, size // 500),
+        )
+        self.pptx = build_pptx(
+            self.root / "deck.pptx",
+            slides=max(1, size // 20),
+            media=max(1, size // 200),
+        )
+        self.docx_dir = self.root / "doc"
+        self.pptx_dir = self.root / "deck"
+        unpack(self.docx, self.docx_dir)
+        unpack(self.pptx, self.pptx_dir)
+
+    def copy(self, source):
+        """Return a fresh copy of an unpacked document."""
+        target = Path(tempfile.mkdtemp(dir=self.root))
+        shutil.copytree(source, target, dirs_exist_ok=True)
+        return target
+
+
+def unpack(office_file, output_dir):
+    """Run unpack.py in this process."""
+    argv = sys.argv
+    sys.argv = ["unpack.py", str(office_file), str(output_dir)]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(str(SCRIPTS_DIR / "unpack.py"), run_name="__main__")
+    finally:
+        sys.argv = argv
+
+
+def validate(validator_classes, unpacked_dir, original_file):
+    """Run validators the way validate.py does; raise if one fails."""
+    for V in validator_classes:
+        validator = V(unpacked_dir, original_file)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                valid = validator.validate()
+        finally:
+            if hasattr(validator, "close"):
+                validator.close()
+        if not valid:
+            raise RuntimeError(f"{V.__name__} failed:\n{output.getvalue()}")
+
+
+def lookup_nodes(editor, lookups=20):
+    """Look up paragraphs, tracked changes and text spread over a document."""
+    paragraphs = editor.dom.getElementsByTagName("w:p")
+    insertions = editor.dom.getElementsByTagName("w:ins")
+    for i in range(lookups):
+        paragraph = paragraphs[i * len(paragraphs) // lookups]
+        editor.get_node(tag="w:p", line_number=paragraph.parse_position[0])
+        insertion = insertions[i * len(insertions) // lookups]
+        editor.get_node(tag="w:ins", attrs={"w:id": insertion.getAttribute("w:id")})
+    editor.get_node(tag="w:p", line_number=range(1, 10**9), contains=_last_text(editor))
+
+
+def _last_text(editor):
+    texts = editor.dom.getElementsByTagName("w:t")
+    return texts[-1].firstChild.data.strip()
+
+
+def edit_session(unpacked_dir, output_dir, edits=20):
+    """Run a Document session with tracked deletions, an insertion and comments."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        doc = Document(unpacked_dir, author="Claude")
+        editor = doc["word/document.xml"]
+        runs = [
+            run
+            for run in editor.dom.getElementsByTagName("w:r")
+            if run.getElementsByTagName("w:t") and run.parentNode.tagName == "w:p"
+        ]
+        for i in range(edits):
+            run = runs[i * len(runs) // edits]
+            editor.suggest_deletion(run)
+            if i % 4 == 0:
+                paragraph = run.parentNode
+                doc.add_comment(start=paragraph, end=paragraph, text="Benchmark")
+        last = editor.dom.getElementsByTagName("w:p")[-1]
+        editor.insert_after(
+            last, "<w:p><w:ins><w:r><w:t>Added paragraph</w:t></w:r></w:ins></w:p>"
+        )
+        doc.save(output_dir, validate=True)
+
+
+def stages(corpus):
+    """Return {stage name: (setup, run)}; setup's result is passed to run."""
+    docx_validators = [DOCXSchemaValidator, RedliningValidator]
+    result = {
+        "docx.unpack": (
+            lambda: corpus.root / f"unpacked-{time.monotonic_ns()}",
+            lambda target: unpack(corpus.docx, target),
+        ),
+        "docx.pack": (
+            lambda: corpus.root / f"packed-{time.monotonic_ns()}.docx",
+            lambda target: pack_document(corpus.docx_dir, target),
+        ),
+        "docx.validate": (
+            lambda: None,
+            lambda _: validate(docx_validators, corpus.docx_dir, corpus.docx),
+        ),
+        "pptx.unpack": (
+            lambda: corpus.root / f"unpacked-{time.monotonic_ns()}",
+            lambda target: unpack(corpus.pptx, target),
+        ),
+        "pptx.pack": (
+            lambda: corpus.root / f"packed-{time.monotonic_ns()}.pptx",
+            lambda target: pack_document(corpus.pptx_dir, target),
+        ),
+        "pptx.validate": (
+            lambda: None,
+            lambda _: validate([PPTXSchemaValidator], corpus.pptx_dir, corpus.pptx),
+        ),
+    }
+    if Document is not None:
+        document_xml = corpus.docx_dir / "word" / "document.xml"
+        result["docx.editor_load"] = (lambda: None, lambda _: XMLEditor(document_xml))
+        result["docx.get_node"] = (
+            lambda: XMLEditor(document_xml),
+            lambda editor: lookup_nodes(editor),
+        )
+        result["docx.session"] = (
+            lambda: (corpus.copy(corpus.docx_dir), corpus.root / "saved"),
+            lambda paths: edit_session(*paths),
+        )
+    return result
+
+
+def run_benchmarks(sizes, repeat, selected=None):
+    """Time every stage at every size.
+
+    Returns:
+        dict: {stage: {size: best time in seconds}}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="ooxml-bench-") as temp_dir:
+        for size in sizes:
+            root = Path(temp_dir) / str(size)
+            root.mkdir()
+            corpus = Corpus(root, size)
+            for name, (setup, run) in stages(corpus).items():
+                if selected and name not in selected:
+                    continue
+                if size == sizes[0]:
+                    # Untimed warm-up run: loads schemas and imports lazily
+                    # used modules, which would otherwise count as the
+                    # smallest size's time
+                    run(setup())
+                times = []
+                for _ in range(repeat):
+                    state = setup()
+                    times.append(_time(run, state))
+                results.setdefault(name, {})[str(size)] = min(times)
+                print(f"  {name:<18} {size:>7}  {min(times) * 1000:10.1f} ms")
+    return results
+
+
+def _time(run, state):
+    """Return the seconds run(state) takes, with the garbage collector off.
+
+    Like timeit, collection is paused so a pause triggered by earlier
+    allocations is not charged to whichever stage happens to be running.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        run(state)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def scaling_problems(results, max_exponent=MAX_EXPONENT):
+    """Return messages for stages growing faster than size ** max_exponent."""
+    problems = []
+    for name, timings in results.items():
+        sizes = sorted(timings, key=int)
+        for small, large in zip(sizes, sizes[1:]):
+            t_small, t_large = timings[small], timings[large]
+            if t_large < NOISE_FLOOR or t_small <= 0:
+                continue
+            exponent = math.log(t_large / t_small) / math.log(int(large) / int(small))
+            if exponent > max_exponent:
+                problems.append(
+                    f"{name}: time grows as size^{exponent:.2f} "
+                    f"from {small} to {large} (limit {max_exponent})"
+                )
+    return problems
+
+
+def regressions(results, baseline, tolerance=TOLERANCE):
+    """Return messages for timings more than tolerance above the baseline."""
+    problems = []
+    for name, timings in results.items():
+        for size, elapsed in timings.items():
+            expected = baseline.get(name, {}).get(size)
+            if expected is None or elapsed < NOISE_FLOOR:
+                continue
+            if elapsed > expected * (1 + tolerance):
+                problems.append(
+                    f"{name} at {size}: {elapsed * 1000:.1f} ms, baseline "
+                    f"{expected * 1000:.1f} ms (+{elapsed / expected - 1:.0%})"
+                )
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the OOXML scripts")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="Comma-separated document sizes in paragraphs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per stage; the best counts"
+    )
+    parser.add_argument("--stages", help="Comma-separated stages to run (default: all)")
+    parser.add_argument("--save", metavar="PATH", help="Write the results to PATH")
+    parser.add_argument(
+        "--baseline", metavar="PATH", help="Fail on regressions against PATH"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="Allowed slowdown against the baseline (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-exponent",
+        type=float,
+        default=MAX_EXPONENT,
+        help="Allowed growth exponent between sizes (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    selected = set(args.stages.split(",")) if args.stages else None
+    os.environ["OOXML_XSD_CACHE"] = ""
+
+    results = run_benchmarks(sizes, args.repeat, selected)
+    problems = scaling_problems(results, args.max_exponent)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+        problems.extend(regressions(results, baseline, args.tolerance))
+
+    if args.save:
+        report = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+            "results": results,
+        }
+        Path(args.save).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Results written to {args.save}")
+
+    if problems:
+        print("\nFAILED - Performance problems found:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print("\nPASSED - No superlinear stages or regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic .docx and .pptx files of a chosen size for benchmarking.
+
+The packages are minimal but schema-valid, so every stage (unpack, pack,
+validate, editing) does its real work on them. Content is deterministic for
+a given seed, so timings from different runs compare like for like.
+
+Example usage:
+    python corpus.py report.docx --paragraphs 5000 --tracked-changes 200 --comments 50
+    python corpus.py deck.pptx --slides 100 --media 10
+"""
+
+import argparse
+import random
+import struct
+import zipfile
+import zlib
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+WP_NS = "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+PIC_NS = "http://schemas.openxmlformats.org/drawingml/2006/picture"
+W14_NS = "http://schemas.microsoft.com/office/word/2010/wordml"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+W15_NS = "http://schemas.microsoft.com/office/word/2012/wordml"
+W16CID_NS = "http://schemas.microsoft.com/office/word/2016/wordml/cid"
+W16CEX_NS = "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+MS_RT = "http://schemas.microsoft.com/office"
+CT = "application/vnd.openxmlformats-officedocument"
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+DATE = "2024-01-01T00:00:00Z"
+
+# Words the generated text is drawn from
+WORDS = (
+    "the agreement party shall provide notice within thirty days of any change "
+    "to the terms scope schedule budget or deliverables described in this "
+    "section including amendments approved by both parties in writing"
+).split()
+
+# Namespaces Word declares on every story part; paragraphs carry w14:paraId
+W_ROOT_NAMESPACES = (
+    f'xmlns:w="{W_NS}" xmlns:r="{R_NS}" xmlns:mc="{MC_NS}" xmlns:w14="{W14_NS}" '
+    'mc:Ignorable="w14"'
+)
+
+# EMU per pixel at 96 dpi
+EMU_PER_PIXEL = 9525
+
+
+def build_docx(
+    path,
+    paragraphs=100,
+    runs=3,
+    tracked_changes=0,
+    comments=0,
+    media=0,
+    media_bytes=20000,
+    author="Reviewer",
+    seed=0,
+):
+    """Write a Word document with the given amount of content.
+
+    Tracked changes and comments are spread evenly over the paragraphs;
+    changes alternate between insertions and deletions by author.
+
+    Args:
+        path: Output .docx file
+        paragraphs: Number of body paragraphs
+        runs: Text runs per paragraph
+        tracked_changes: Paragraphs that get a tracked insertion or deletion
+        comments: Paragraphs that get a comment
+        media: Number of embedded PNG images
+        media_bytes: Approximate size of each image
+        author: Author of the tracked changes and comments
+        seed: Seed for the generated text
+
+    Returns:
+        Path: The written file
+    """
+    rng = random.Random(seed)
+    change_at = _spread(tracked_changes, paragraphs)
+    comment_at = _spread(comments, paragraphs)
+    media_at = _spread(media, paragraphs)
+
+    body = []
+    comment_parts = []
+    comment_para_ids = []
+    rels = [
+        ("rId1", f"{RT}/styles", "styles.xml"),
+        ("rId2", f"{RT}/settings", "settings.xml"),
+    ]
+    media_files = {}
+    ids = iter(range(1, 10**9))
+    para_ids = (f"{n:08X}" for n in range(1, 0x80000000))
+    changes = 0
+    for index in range(paragraphs):
+        content = [_w_run(_sentence(rng)) for _ in range(runs)]
+
+        if index in change_at:
+            changes += 1
+            text = _sentence(rng)
+            if changes % 2:
+                change, run = "ins", _w_run(text)
+            else:
+                change, run = "del", _w_run(text, tag="delText")
+            content.append(
+                f'<w:{change} w:id="{next(ids)}" w:author="{author}" '
+                f'w:date="{DATE}">{run}</w:{change}>'
+            )
+
+        if index in comment_at:
+            comment_id = len(comment_parts)
+            content.insert(0, f'<w:commentRangeStart w:id="{comment_id}"/>')
+            content.append(f'<w:commentRangeEnd w:id="{comment_id}"/>')
+            content.append(
+                '<w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr>'
+                f'<w:commentReference w:id="{comment_id}"/></w:r>'
+            )
+            para_id = next(para_ids)
+            comment_parts.append(
+                f'<w:comment w:id="{comment_id}" w:author="{author}" '
+                f'w:date="{DATE}" w:initials="{author[:1]}">'
+                f'<w:p w14:paraId="{para_id}" w14:textId="77777777">'
+                f"{_w_run(_sentence(rng))}</w:p></w:comment>"
+            )
+            comment_para_ids.append(para_id)
+
+        if index in media_at:
+            number = len(media_files) + 1
+            rel_id = f"rId{len(rels) + 1}"
+            name = f"image{number}.png"
+            media_files[f"word/media/{name}"] = _png(media_bytes, rng)
+            rels.append((rel_id, f"{RT}/image", f"media/{name}"))
+            content.append(_w_drawing(next(ids), name, rel_id))
+
+        body.append(
+            f'<w:p w14:paraId="{next(para_ids)}" w14:textId="77777777">'
+            f"{''.join(content)}</w:p>"
+        )
+
+    body.append(
+        '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/><w:pgMar w:top="1440" '
+        'w:right="1440" w:bottom="1440" w:left="1440" w:header="720" '
+        'w:footer="720" w:gutter="0"/></w:sectPr>'
+    )
+
+    overrides = {
+        "/word/document.xml": "wordprocessingml.document.main+xml",
+        "/word/styles.xml": "wordprocessingml.styles+xml",
+        "/word/settings.xml": "wordprocessingml.settings+xml",
+    }
+    parts = {
+        "word/document.xml": (
+            f'<w:document {W_ROOT_NAMESPACES} xmlns:wp="{WP_NS}" xmlns:a="{A_NS}" '
+            f'xmlns:pic="{PIC_NS}"><w:body>{"".join(body)}</w:body></w:document>'
+        ),
+        "word/styles.xml": DOCX_STYLES,
+        "word/settings.xml": DOCX_SETTINGS,
+    }
+    if comment_parts:
+        # Word writes three companion parts next to comments.xml
+        parts["word/comments.xml"] = (
+            f"<w:comments {W_ROOT_NAMESPACES}>{''.join(comment_parts)}</w:comments>"
+        )
+        durable_ids = [f"{0x10000000 + n:08X}" for n in range(len(comment_parts))]
+        parts["word/commentsExtended.xml"] = (
+            f'<w15:commentsEx xmlns:w15="{W15_NS}">'
+            + "".join(
+                f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
+                for para_id in comment_para_ids
+            )
+            + "</w15:commentsEx>"
+        )
+        parts["word/commentsIds.xml"] = (
+            f'<w16cid:commentsIds xmlns:w16cid="{W16CID_NS}">'
+            + "".join(
+                f'<w16cid:commentId w16cid:paraId="{para_id}" '
+                f'w16cid:durableId="{durable_id}"/>'
+                for para_id, durable_id in zip(comment_para_ids, durable_ids)
+            )
+            + "</w16cid:commentsIds>"
+        )
+        parts["word/commentsExtensible.xml"] = (
+            f'<w16cex:commentsExtensible xmlns:w16cex="{W16CEX_NS}">'
+            + "".join(
+                f'<w16cex:commentExtensible w16cex:durableId="{durable_id}" '
+                f'w16cex:dateUtc="{DATE}"/>'
+                for durable_id in durable_ids
+            )
+            + "</w16cex:commentsExtensible>"
+        )
+        for name, rel_type in [
+            ("comments", f"{RT}/comments"),
+            ("commentsExtended", f"{MS_RT}/2011/relationships/commentsExtended"),
+            ("commentsIds", f"{MS_RT}/2016/09/relationships/commentsIds"),
+            ("commentsExtensible", f"{MS_RT}/2018/08/relationships/commentsExtensible"),
+        ]:
+            rels.append((f"rId{len(rels) + 1}", rel_type, f"{name}.xml"))
+            overrides[f"/word/{name}.xml"] = f"wordprocessingml.{name}+xml"
+    parts["word/_rels/document.xml.rels"] = _relationships(rels)
+    parts["_rels/.rels"] = _relationships(
+        [("rId1", f"{RT}/officeDocument", "word/document.xml")]
+    )
+    parts["[Content_Types].xml"] = _content_types(overrides, png=bool(media_files))
+    return _write_package(path, parts, media_files)
+
+
+def build_pptx(path, slides=10, shapes=3, media=0, media_bytes=20000, seed=0):
+    """Write a presentation with the given number of slides.
+
+    Every slide uses the single layout and holds text boxes and, spread over
+    the deck, one picture per media file.
+
+    Args:
+        path: Output .pptx file
+        slides: Number of slides
+        shapes: Text boxes per slide
+        media: Number of embedded PNG images
+        media_bytes: Approximate size of each image
+        seed: Seed for the generated text
+
+    Returns:
+        Path: The written file
+    """
+    rng = random.Random(seed)
+    media_at = _spread(media, slides)
+    media_files = {}
+    overrides = {
+        "/ppt/presentation.xml": "presentationml.presentation.main+xml",
+        "/ppt/slideMasters/slideMaster1.xml": "presentationml.slideMaster+xml",
+        "/ppt/slideLayouts/slideLayout1.xml": "presentationml.slideLayout+xml",
+        "/ppt/theme/theme1.xml": "theme+xml",
+    }
+    parts = {
+        "ppt/slideMasters/slideMaster1.xml": PPTX_SLIDE_MASTER,
+        "ppt/slideMasters/_rels/slideMaster1.xml.rels": _relationships(
+            [
+                ("rId1", f"{RT}/slideLayout", "../slideLayouts/slideLayout1.xml"),
+                ("rId2", f"{RT}/theme", "../theme/theme1.xml"),
+            ]
+        ),
+        "ppt/slideLayouts/slideLayout1.xml": PPTX_SLIDE_LAYOUT,
+        "ppt/slideLayouts/_rels/slideLayout1.xml.rels": _relationships(
+            [("rId1", f"{RT}/slideMaster", "../slideMasters/slideMaster1.xml")]
+        ),
+        "ppt/theme/theme1.xml": PPTX_THEME,
+    }
+    presentation_rels = [
+        ("rId1", f"{RT}/slideMaster", "slideMasters/slideMaster1.xml"),
+        ("rId2", f"{RT}/theme", "theme/theme1.xml"),
+    ]
+    slide_ids = []
+
+    for index in range(slides):
+        number = index + 1
+        slide_rels = [("rId1", f"{RT}/slideLayout", "../slideLayouts/slideLayout1.xml")]
+        shape_xml = [
+            _p_text_box(shape_id + 2, shape_id, _sentence(rng))
+            for shape_id in range(shapes)
+        ]
+        if index in media_at:
+            name = f"image{len(media_files) + 1}.png"
+            media_files[f"ppt/media/{name}"] = _png(media_bytes, rng)
+            slide_rels.append(("rId2", f"{RT}/image", f"../media/{name}"))
+            shape_xml.append(_p_picture(shapes + 2, name, "rId2"))
+
+        parts[f"ppt/slides/slide{number}.xml"] = (
+            f'<p:sld xmlns:a="{A_NS}" xmlns:r="{R_NS}" xmlns:p="{P_NS}">'
+            f"<p:cSld><p:spTree>{_P_GROUP_PROPERTIES}{''.join(shape_xml)}"
+            "</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>"
+            "</p:sld>"
+        )
+        parts[f"ppt/slides/_rels/slide{number}.xml.rels"] = _relationships(slide_rels)
+        overrides[f"/ppt/slides/slide{number}.xml"] = "presentationml.slide+xml"
+        rel_id = f"rId{len(presentation_rels) + 1}"
+        presentation_rels.append((rel_id, f"{RT}/slide", f"slides/slide{number}.xml"))
+        slide_ids.append(f'<p:sldId id="{256 + index}" r:id="{rel_id}"/>')
+
+    slide_list = f"<p:sldIdLst>{''.join(slide_ids)}</p:sldIdLst>" if slide_ids else ""
+    parts["ppt/presentation.xml"] = (
+        f'<p:presentation xmlns:a="{A_NS}" xmlns:r="{R_NS}" xmlns:p="{P_NS}">'
+        '<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/>'
+        f"</p:sldMasterIdLst>{slide_list}"
+        '<p:sldSz cx="9144000" cy="6858000"/><p:notesSz cx="6858000" cy="9144000"/>'
+        "</p:presentation>"
+    )
+    parts["ppt/_rels/presentation.xml.rels"] = _relationships(presentation_rels)
+    parts["_rels/.rels"] = _relationships(
+        [("rId1", f"{RT}/officeDocument", "ppt/presentation.xml")]
+    )
+    parts["[Content_Types].xml"] = _content_types(overrides, png=bool(media_files))
+    return _write_package(path, parts, media_files)
+
+
+def _spread(count, total):
+    """Return a set of count indices spread evenly over range(total)."""
+    count = min(count, total)
+    if count <= 0:
+        return set()
+    return {i * total // count for i in range(count)}
+
+
+def _sentence(rng, words=8):
+    return " ".join(rng.choice(WORDS) for _ in range(words)) + " "
+
+
+def _w_run(text, tag="t"):
+    return f'<w:r><w:{tag} xml:space="preserve">{escape(text)}</w:{tag}></w:r>'
+
+
+def _w_drawing(drawing_id, name, rel_id, pixels=100):
+    size = pixels * EMU_PER_PIXEL
+    return (
+        f'<w:r><w:drawing><wp:inline distT="0" distB="0" distL="0" distR="0">'
+        f'<wp:extent cx="{size}" cy="{size}"/>'
+        f'<wp:docPr id="{drawing_id}" name="Picture {drawing_id}"/>'
+        f'<a:graphic><a:graphicData uri="{PIC_NS}"><pic:pic>'
+        f'<pic:nvPicPr><pic:cNvPr id="{drawing_id}" name="{name}"/><pic:cNvPicPr/>'
+        f'</pic:nvPicPr><pic:blipFill><a:blip r:embed="{rel_id}"/>'
+        "<a:stretch><a:fillRect/></a:stretch></pic:blipFill><pic:spPr><a:xfrm>"
+        f'<a:off x="0" y="0"/><a:ext cx="{size}" cy="{size}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr></pic:pic>'
+        "</a:graphicData></a:graphic></wp:inline></w:drawing></w:r>"
+    )
+
+
+def _p_text_box(shape_id, index, text):
+    y = 457200 + index * 914400
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {shape_id}"/>'
+        '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr><p:spPr><a:xfrm>'
+        f'<a:off x="457200" y="{y}"/><a:ext cx="8229600" cy="914400"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr><p:txBody>'
+        '<a:bodyPr/><a:lstStyle/><a:p><a:r><a:rPr lang="en-US"/>'
+        f"<a:t>{escape(text)}</a:t></a:r></a:p></p:txBody></p:sp>"
+    )
+
+
+def _p_picture(shape_id, name, rel_id, pixels=100):
+    size = pixels * EMU_PER_PIXEL
+    return (
+        f'<p:pic><p:nvPicPr><p:cNvPr id="{shape_id}" name="{name}"/><p:cNvPicPr/>'
+        f'<p:nvPr/></p:nvPicPr><p:blipFill><a:blip r:embed="{rel_id}"/>'
+        "<a:stretch><a:fillRect/></a:stretch></p:blipFill><p:spPr><a:xfrm>"
+        f'<a:off x="0" y="0"/><a:ext cx="{size}" cy="{size}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>'
+    )
+
+
+def _png(size, rng):
+    """Return an RGB PNG of noise, about size bytes long."""
+    side = max(1, int((size / 3) ** 0.5))
+    rows = b"".join(b"\x00" + rng.randbytes(side * 3) for _ in range(side))
+
+    def chunk(kind, data):
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data))
+        )
+
+    header = struct.pack(">IIBBBBB", side, side, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _relationships(rels):
+    entries = "".join(
+        f'<Relationship Id="{rel_id}" Type="{rel_type}" Target="{target}"/>'
+        for rel_id, rel_type, target in rels
+    )
+    return f'<Relationships xmlns="{REL_NS}">{entries}</Relationships>'
+
+
+def _content_types(overrides, png=False):
+    defaults = [
+        ("rels", "application/vnd.openxmlformats-package.relationships+xml"),
+        ("xml", "application/xml"),
+    ]
+    if png:
+        defaults.append(("png", "image/png"))
+    entries = [
+        f'<Default Extension="{ext}" ContentType="{content_type}"/>'
+        for ext, content_type in defaults
+    ]
+    entries.extend(
+        f'<Override PartName="{name}" ContentType="{CT}.{content_type}"/>'
+        for name, content_type in overrides.items()
+    )
+    return f'<Types xmlns="{CT_NS}">{"".join(entries)}</Types>'
+
+
+def _write_package(path, parts, media_files):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        # [Content_Types].xml goes first, as Office writes it
+        for name in sorted(parts, key=lambda name: name != "[Content_Types].xml"):
+            zf.writestr(name, XML_DECLARATION + parts[name])
+        for name, content in media_files.items():
+            zf.writestr(name, content, compress_type=zipfile.ZIP_STORED)
+    return path
+
+
+DOCX_STYLES = (
+    f'<w:styles xmlns:w="{W_NS}"><w:docDefaults><w:rPrDefault><w:rPr>'
+    '<w:sz w:val="22"/></w:rPr></w:rPrDefault></w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+    '<w:name w:val="Normal"/><w:qFormat/></w:style>'
+    '<w:style w:type="character" w:styleId="CommentReference">'
+    '<w:name w:val="annotation reference"/><w:rPr><w:sz w:val="16"/></w:rPr>'
+    "</w:style></w:styles>"
+)
+
+DOCX_SETTINGS = (
+    f'<w:settings xmlns:w="{W_NS}"><w:zoom w:percent="100"/>'
+    '<w:defaultTabStop w:val="720"/><w:characterSpacingControl w:val="doNotCompress"/>'
+    '<w:compat><w:compatSetting w:name="compatibilityMode" '
+    'w:uri="http://schemas.microsoft.com/office/word" w:val="15"/></w:compat>'
+    "</w:settings>"
+)
+
+_P_GROUP_PROPERTIES = (
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    "<p:grpSpPr/>"
+)
+
+PPTX_SLIDE_MASTER = (
+    f'<p:sldMaster xmlns:a="{A_NS}" xmlns:r="{R_NS}" xmlns:p="{P_NS}">'
+    f"<p:cSld><p:spTree>{_P_GROUP_PROPERTIES}</p:spTree></p:cSld>"
+    '<p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" '
+    'accent2="accent2" accent3="accent3" accent4="accent4" accent5="accent5" '
+    'accent6="accent6" hlink="hlink" folHlink="folHlink"/>'
+    '<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/>'
+    "</p:sldLayoutIdLst></p:sldMaster>"
+)
+
+PPTX_SLIDE_LAYOUT = (
+    f'<p:sldLayout xmlns:a="{A_NS}" xmlns:r="{R_NS}" xmlns:p="{P_NS}" '
+    'type="blank" preserve="1"><p:cSld name="Blank"><p:spTree>'
+    f"{_P_GROUP_PROPERTIES}</p:spTree></p:cSld>"
+    "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>"
+)
+
+
+def _theme_colors():
+    colors = [
+        ("dk1", "000000"),
+        ("lt1", "FFFFFF"),
+        ("dk2", "1F497D"),
+        ("lt2", "EEECE1"),
+        ("accent1", "4F81BD"),
+        ("accent2", "C0504D"),
+        ("accent3", "9BBB59"),
+        ("accent4", "8064A2"),
+        ("accent5", "4BACC6"),
+        ("accent6", "F79646"),
+        ("hlink", "0000FF"),
+        ("folHlink", "800080"),
+    ]
+    return "".join(
+        f'<a:{name}><a:srgbClr val="{value}"/></a:{name}>' for name, value in colors
+    )
+
+
+def _theme_font(kind):
+    return (
+        f'<a:{kind}><a:latin typeface="Calibri"/><a:ea typeface=""/>'
+        f'<a:cs typeface=""/></a:{kind}>'
+    )
+
+
+_FILL = '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>'
+_LINE = f'<a:ln w="9525">{_FILL}</a:ln>'
+_EFFECT = "<a:effectStyle><a:effectLst/></a:effectStyle>"
+
+PPTX_THEME = (
+    f'<a:theme xmlns:a="{A_NS}" name="Office Theme"><a:themeElements>'
+    f'<a:clrScheme name="Office">{_theme_colors()}</a:clrScheme>'
+    f'<a:fontScheme name="Office">{_theme_font("majorFont")}'
+    f"{_theme_font('minorFont')}</a:fontScheme>"
+    '<a:fmtScheme name="Office">'
+    f"<a:fillStyleLst>{_FILL * 3}</a:fillStyleLst>"
+    f"<a:lnStyleLst>{_LINE * 3}</a:lnStyleLst>"
+    f"<a:effectStyleLst>{_EFFECT * 3}</a:effectStyleLst>"
+    f"<a:bgFillStyleLst>{_FILL * 3}</a:bgFillStyleLst>"
+    "</a:fmtScheme></a:themeElements></a:theme>"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic .docx or .pptx file for benchmarking"
+    )
+    parser.add_argument("output_file", help="Output file (.docx or .pptx)")
+    parser.add_argument("--paragraphs", type=int, default=100, help="docx only")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per paragraph")
+    parser.add_argument("--tracked-changes", type=int, default=0, help="docx only")
+    parser.add_argument("--comments", type=int, default=0, help="docx only")
+    parser.add_argument("--slides", type=int, default=10, help="pptx only")
+    parser.add_argument("--shapes", type=int, default=3, help="Text boxes per slide")
+    parser.add_argument("--media", type=int, default=0, help="Number of images")
+    parser.add_argument(
+        "--media-bytes", type=int, default=20000, help="Approximate image size"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the text")
+    args = parser.parse_args()
+
+    match Path(args.output_file).suffix.lower():
+        case ".docx":
+            build_docx(
+                args.output_file,
+                paragraphs=args.paragraphs,
+                runs=args.runs,
+                tracked_changes=args.tracked_changes,
+                comments=args.comments,
+                media=args.media,
+                media_bytes=args.media_bytes,
+                seed=args.seed,
+            )
+        case ".pptx":
+            build_pptx(
+                args.output_file,
+                slides=args.slides,
+                shapes=args.shapes,
+                media=args.media,
+                media_bytes=args.media_bytes,
+                seed=args.seed,
+            )
+        case suffix:
+            raise SystemExit(f"Error: unsupported file type {suffix}")
+
+
+if __name__ == "__main__":
+    main()
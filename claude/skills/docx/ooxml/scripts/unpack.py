@@ -2,26 +2,34 @@
 """Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
 
 import random
+import shutil
 import sys
-import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
+from pack import write_pretty_xml
+
 # Get command line arguments
 assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
 input_file, output_dir = sys.argv[1], sys.argv[2]
 
-# Extract and format
+# Extract parts, pretty printing XML on the fly so nothing is written twice
 output_path = Path(output_dir)
 output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
+with zipfile.ZipFile(input_file) as zf:
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        target = output_path / info.filename
+        # Refuse member names that would escape the output directory
+        if not target.resolve().is_relative_to(output_path.resolve()):
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with zf.open(info) as src, open(target, "wb") as dst:
+            if info.filename.endswith((".xml", ".rels")):
+                write_pretty_xml(src, dst)
+            else:
+                shutil.copyfileobj(src, dst)
 
 # For .docx files, suggest an RSID for tracked changes
 if input_file.endswith(".docx"):
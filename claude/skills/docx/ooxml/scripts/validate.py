@@ -3,21 +3,40 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N]
+    python validate.py <packed_file> --original <original_file> [--jobs N]
+    python validate.py <dir> --original <original_file> --profile trace.json
+
+A packed file (.docx/.pptx/.xlsx) is validated straight from the archive;
+nothing is extracted to disk.
+
+Pass --profile PATH to record the time spent in each check and part (see
+validation/profiling.py for the formats).
+
+XSD errors already present in the original are cached across runs in
+~/.cache/ooxml-validation/xsd-errors.sqlite3. Set OOXML_XSD_CACHE to use
+another database file, or to an empty string to turn the cache off.
 """
 
 import argparse
 import sys
+import zipfile
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+    profiling,
+)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        help="Path to unpacked Office document directory, or to a packed file",
     )
     parser.add_argument(
         "--original",
@@ -30,17 +49,28 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for per-file checks (default: 1)",
+    )
+    profiling.add_arguments(parser)
     args = parser.parse_args()
 
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.is_dir() or zipfile.is_zipfile(unpacked_dir), (
+        f"Error: {unpacked_dir} is not a directory or a packed Office file"
+    )
     assert original_file.is_file(), f"Error: {original_file} is not a file"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
+    assert args.jobs >= 1, "Error: --jobs must be at least 1"
 
     # Run validations
     match file_extension:
@@ -54,10 +84,20 @@ def main():
 
     # Run validators
     success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    with profiling.profile_to(args.profile, args.profile_format):
+        for V in validators:
+            if issubclass(V, BaseSchemaValidator):
+                validator = V(
+                    unpacked_dir, original_file, verbose=args.verbose, jobs=args.jobs
+                )
+            else:
+                validator = V(unpacked_dir, original_file, verbose=args.verbose)
+            try:
+                with profiling.span(V.__name__, "validator"):
+                    if not validator.validate():
+                        success = False
+            finally:
+                validator.close()
 
     if success:
         print("All validations PASSED!")
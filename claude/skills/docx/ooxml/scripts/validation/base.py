@@ -2,11 +2,21 @@
 Base validator with common validation logic for document files.
 """
 
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import posixpath
 import re
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 import lxml.etree
 
+from . import profiling
+from .errorcache import open_error_cache, schema_version
+from .memo import RunRecord
+from .package import DirectoryPackage, SessionPackage, ZipPackage, open_package
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,35 +113,276 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        jobs=1,
+        incremental=False,
+        source_dir=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
+        # Folder supplying the non-XML parts a partial working tree (such as a
+        # Document session's) has not written; see SessionPackage
+        self.source_dir = source_dir
         self.verbose = verbose
+        self.jobs = jobs
+        self.incremental = incremental
+        self._executor = None
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
+        # Every part is read through a package view, so a packed file is
+        # validated straight from its archive without unpacking it. Paths
+        # below are still unpacked_dir / part name, virtual for an archive.
+        if self.unpacked_dir.is_file():
+            self.package = ZipPackage(self.unpacked_dir)
+        elif source_dir is not None:
+            self.package = SessionPackage(self.unpacked_dir, source_dir)
+        else:
+            self.package = DirectoryPackage(self.unpacked_dir)
+
+        # Part names and sizes, listed once; every existence check and
+        # reference lookup below is answered from it
+        self.parts = self.package.manifest
+
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
+        patterns = [".xml", ".rels"]
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            self.unpacked_dir / name
+            for pattern in patterns
+            for name in self.parts
+            if name.endswith(pattern)
         ]
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parsed trees (or parse errors) by path, shared by every check
+        self._parsed = {}
+
+        # Per-part facts computed during this run, recorded on success
+        self._facts = {}
+
+    @functools.cached_property
+    def original_package(self):
+        """Shared in-memory view of the original file, opened on first use.
+
+        Kept on the validator so the original is opened, and for a directory
+        listed, once per run rather than on every read.
+        """
+        return open_package(self.original_file)
+
+    def _parse_xml(self, xml_file):
+        """Return the parsed tree for a file, parsing it at most once per validator.
+
+        The returned tree is shared by all checks and must not be modified;
+        checks that need to mutate it should work on a copy.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        key = str(xml_file)
+        if key not in self._parsed:
+            name = self._part_name(xml_file)
+            try:
+                content = self.package.read(name)
+                if content is None:
+                    raise FileNotFoundError(f"No such part: {xml_file}")
+                profiling.count("parts_parsed")
+                with profiling.span("parse", "part", part=name):
+                    self._parsed[key] = lxml.etree.fromstring(
+                        content, base_url=key
+                    ).getroottree()
+            except Exception as e:
+                self._parsed[key] = e
+        result = self._parsed[key]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _map_files(self, method_name, files):
+        """Apply a per-file method to each file, in order, and return the results.
+
+        With jobs > 1 the calls are fanned out to a process pool whose workers
+        each hold their own validator for the same package; results come back
+        in input order so callers can merge them deterministically.
+        """
+        if self.jobs <= 1 or len(files) <= 1:
+            return [getattr(self, method_name)(f) for f in files]
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_worker,
+                initargs=(
+                    type(self),
+                    self.unpacked_dir,
+                    self.original_file,
+                    self.source_dir,
+                ),
+            )
+        chunksize = max(1, len(files) // (self.jobs * 4))
+        return list(
+            self._executor.map(
+                _call_in_worker,
+                [method_name] * len(files),
+                files,
+                chunksize=chunksize,
+            )
+        )
+
+    def close(self):
+        """Shut down the worker pool, if one was started, and close the package."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.package.close()
+
+    def _part_name(self, xml_file):
+        """Return the package part name (posix path relative to unpacked_dir)."""
+        return Path(xml_file).relative_to(self.unpacked_dir).as_posix()
+
+    def _glob_parts(self, pattern):
+        """Return the paths of parts matching a glob pattern in one folder.
+
+        Like Path.glob() on the unpacked directory, but answered from the
+        manifest; "*" does not cross folders.
+        """
+        return [self.unpacked_dir / name for name in self.parts.glob(pattern)]
+
+    def _manifest_key(self):
+        original = self.original_file.resolve()
+        stat = original.stat()
+        return (
+            type(self).__name__,
+            str(self.unpacked_dir),
+            str(original),
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+
+    @functools.cached_property
+    def part_hashes(self):
+        """SHA-256 of every XML part, keyed by part name."""
+        return {
+            self._part_name(f): hashlib.sha256(
+                self.package.read(self._part_name(f))
+            ).hexdigest()
+            for f in self.xml_files
+        }
+
+    @functools.cached_property
+    def _previous_manifest(self):
+        """Manifest of the last successful run on this package, if reusable."""
+        if not self.incremental:
+            return None
+        try:
+            return _validated_manifests.get(self.unpacked_dir, self._manifest_key())
+        except OSError:
+            return None
+
+    @functools.cached_property
+    def changed_parts(self):
+        """Names of parts changed since the last successful run, or None if all are.
+
+        A part is changed if its bytes differ from the manifest, it is new, or
+        it was removed. Every part whose .rels file changed, and every part
+        with a relationship pointing at a changed part, is included too.
+        """
+        previous = self._previous_manifest
+        if previous is None:
+            return None
+
+        old_hashes = previous["hashes"]
+        changed = {
+            name
+            for name, digest in self.part_hashes.items()
+            if old_hashes.get(name) != digest
+        }
+        changed |= old_hashes.keys() - self.part_hashes.keys()
+
+        # Sources of changed .rels files and of relationships into changed parts
+        for rels_file in self.xml_files:
+            if rels_file.suffix != ".rels":
+                continue
+            rels_name = self._part_name(rels_file)
+            source = _rels_source_part(rels_name)
+            if source is None:
+                continue
+            if rels_name in changed:
+                changed.add(source)
+                continue
+            try:
+                rels_root = self._parse_xml(rels_file).getroot()
+            except Exception:
+                changed.add(source)
+                continue
+            base_dir = posixpath.dirname(source)
+            for rel in rels_root.iter(
+                f"{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+            ):
+                target = rel.get("Target")
+                if not target or rel.get("TargetMode") == "External":
+                    continue
+                if target.startswith("/"):
+                    target_name = target.lstrip("/")
+                else:
+                    target_name = posixpath.normpath(posixpath.join(base_dir, target))
+                if target_name in changed:
+                    changed.add(source)
+                    break
+
+        return changed
+
+    @property
+    def dirty_files(self):
+        """XML files that per-part checks must examine in this run."""
+        changed = self.changed_parts
+        if changed is None:
+            return self.xml_files
+        return [f for f in self.xml_files if self._part_name(f) in changed]
+
+    def _part_fact(self, xml_file, name, compute):
+        """Return a per-part fact, reusing the last successful run's value if the
+        part is unchanged. Facts are recorded by record_success()."""
+        part = self._part_name(xml_file)
+        changed = self.changed_parts
+        if changed is not None and part not in changed:
+            facts = self._previous_manifest["facts"].get(part, {})
+            if name in facts:
+                self._facts.setdefault(part, {})[name] = facts[name]
+                return facts[name]
+        value = compute(xml_file)
+        self._facts.setdefault(part, {})[name] = value
+        return value
+
+    def record_success(self):
+        """Remember the part hashes of a fully valid package for incremental runs."""
+        if not self.incremental:
+            return
+        _validated_manifests.put(
+            self.unpacked_dir,
+            self._manifest_key(),
+            {"hashes": dict(self.part_hashes), "facts": self._facts},
+        )
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    @profiling.timed()
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.dirty_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self._parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -153,13 +404,14 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    @profiling.timed()
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.dirty_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -183,86 +435,47 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    @profiling.timed()
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
+        # File-scoped checks run per file (possibly in parallel); global IDs
+        # are reconciled here in file order so the output matches a serial run
+        dirty = self.dirty_files
+        collected = dict(
+            zip(map(str, dirty), self._map_files("_collect_unique_ids", dirty))
+        )
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
-
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
+            events = self._part_fact(
+                xml_file,
+                "unique_ids",
+                lambda f: (
+                    collected[str(f)]
+                    if str(f) in collected
+                    else self._collect_unique_ids(f)
+                ),
+            )
+            for event in events:
+                if event[0] == "error":
+                    errors.append(event[1])
+                    continue
 
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                _, id_value, line, tag = event
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        line,
+                        tag,
                     )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -274,6 +487,83 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _collect_unique_ids(self, xml_file):
+        """Check file-scoped ID uniqueness for one file and collect global IDs.
+
+        Returns:
+            list: Events in document order, either ("error", message) or
+            ("global", id_value, sourceline, tag) for IDs that must be unique
+            across all files
+        """
+        events = []
+
+        try:
+            root = self._parse_xml(xml_file).getroot()
+            file_ids = {}  # Track IDs that must be unique within this file
+
+            # Remove all mc:AlternateContent elements from a private copy,
+            # leaving the shared parsed tree intact
+            mc_path = ".//mc:AlternateContent"
+            mc_ns = {"mc": self.MC_NAMESPACE}
+            if root.xpath(mc_path, namespaces=mc_ns):
+                root = copy.deepcopy(root)
+                for elem in root.xpath(mc_path, namespaces=mc_ns):
+                    elem.getparent().remove(elem)
+
+            # Now check IDs in the cleaned tree
+            for elem in root.iter():
+                # Get the element name without namespace
+                tag = (
+                    elem.tag.split("}")[-1].lower()
+                    if "}" in elem.tag
+                    else elem.tag.lower()
+                )
+
+                # Check if this element type has ID uniqueness requirements
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                    # Look for the specified attribute
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        attr_local = (
+                            attr.split("}")[-1].lower() if "}" in attr else attr.lower()
+                        )
+                        if attr_local == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            # Global uniqueness is checked across files by the caller
+                            events.append(("global", id_value, elem.sourceline, tag))
+                        elif scope == "file":
+                            # Check file-level uniqueness
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                events.append(
+                                    (
+                                        "error",
+                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                        f"(first occurrence at line {prev_line})",
+                                    )
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            events.append(
+                ("error", f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}")
+            )
+
+        return events
+
+    @profiling.timed()
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
@@ -281,22 +571,20 @@ class BaseSchemaValidator:
         errors = []
 
         # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_files = [f for f in self.xml_files if f.name.endswith(".rels")]
 
         if not rels_files:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
+        # Get all parts in the package (excluding reference files)
+        all_files = [
+            name
+            for name in self.parts
+            if posixpath.basename(name) != "[Content_Types].xml"
+            and not name.endswith(".rels")
+        ]  # These files are not referenced by .rels
 
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
@@ -310,13 +598,15 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
+                # Targets of the root .rels file are relative to the package
+                # root; other .rels files describe the part in their parent's
+                # parent, e.g. word/_rels/document.xml.rels -> word/
+                rels_name = self._part_name(rels_file)
+                base_dir = posixpath.dirname(posixpath.dirname(rels_name))
 
                 # Find all relationships and their targets
-                referenced_files = set()
                 broken_refs = []
 
                 for rel in rels_root.findall(
@@ -327,25 +617,16 @@ class BaseSchemaValidator:
                     if target and not target.startswith(
                         ("http", "mailto:")
                     ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
+                        # Resolve the target to a part name and check it exists
+                        if target.startswith("/"):
+                            target_name = target.lstrip("/")
+                        else:
+                            target_name = posixpath.normpath(
+                                posixpath.join(base_dir, target)
+                            )
+                        if target_name in self.parts:
+                            all_referenced_files.add(target_name)
                         else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
                             broken_refs.append((target, rel.sourceline))
 
                 # Report broken references
@@ -364,9 +645,8 @@ class BaseSchemaValidator:
         unreferenced_files = set(all_files) - all_referenced_files
 
         if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+            for unref_file in sorted(unreferenced_files, key=PurePosixPath):
+                errors.append(f"  Unreferenced file: {unref_file}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
@@ -385,17 +665,16 @@ class BaseSchemaValidator:
                 )
             return True
 
+    @profiling.timed()
     def validate_all_relationship_ids(self):
         """
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
-        for xml_file in self.xml_files:
+        for xml_file in self.dirty_files:
             # Skip .rels files themselves
             if xml_file.suffix == ".rels":
                 continue
@@ -406,12 +685,12 @@ class BaseSchemaValidator:
             rels_file = rels_dir / f"{xml_file.name}.rels"
 
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            if self._part_name(rels_file) not in self.parts:
                 continue
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -434,7 +713,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._parse_xml(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -519,19 +798,20 @@ class BaseSchemaValidator:
 
         return None
 
+    @profiling.timed()
     def validate_content_types(self):
         """Validate that all content files are properly declared in [Content_Types].xml."""
         errors = []
 
         # Find [Content_Types].xml file
         content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        if "[Content_Types].xml" not in self.parts:
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -575,12 +855,17 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
+            # Get all parts in the package
+            all_files = [PurePosixPath(name) for name in self.parts]
 
-            # Check all XML files for Override declarations
-            for xml_file in self.xml_files:
+            # Check XML files for Override declarations (all of them if the
+            # declarations themselves changed)
+            changed = self.changed_parts
+            if changed is None or "[Content_Types].xml" in changed:
+                declarable_files = self.xml_files
+            else:
+                declarable_files = self.dirty_files
+            for xml_file in declarable_files:
                 path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
                     "\\", "/"
                 )
@@ -593,7 +878,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._parse_xml(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -618,9 +903,8 @@ class BaseSchemaValidator:
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            f'  {file_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
                         )
 
         except Exception as e:
@@ -653,9 +937,11 @@ class BaseSchemaValidator:
         unpacked_dir = self.unpacked_dir.resolve()
 
         # Validate current file
-        is_valid, current_errors = self._validate_single_file_xsd(
-            xml_file, unpacked_dir
-        )
+        part = xml_file.relative_to(unpacked_dir).as_posix()
+        with profiling.span("xsd", "part", part=part):
+            is_valid, current_errors = self._validate_single_file_xsd(
+                xml_file, unpacked_dir
+            )
 
         if is_valid is None:
             return None, set()  # Skipped
@@ -663,7 +949,8 @@ class BaseSchemaValidator:
             return True, set()  # Valid, no errors
 
         # Get errors from original file for this specific file
-        original_errors = self._get_original_file_errors(xml_file)
+        with profiling.span("xsd_original", "part", part=part):
+            original_errors = self._get_original_file_errors(xml_file)
 
         # Compare with original (both are guaranteed to be sets here)
         assert current_errors is not None
@@ -673,7 +960,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -685,6 +972,7 @@ class BaseSchemaValidator:
                 )
             return True, set()
 
+    @profiling.timed()
     def validate_against_xsd(self):
         """Validate XML files against XSD schemas, showing only new errors compared to original."""
         new_errors = []
@@ -692,11 +980,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        xml_files = self.dirty_files
+        results = self._map_files("validate_file_against_xsd", xml_files)
+        for xml_file, (is_valid, new_file_errors) in zip(xml_files, results):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,14 +999,14 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
         # Print summary
         if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
+            print(f"Validated {len(xml_files)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
             if original_error_count:
@@ -762,66 +1049,63 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
-            attrs_to_remove = []
-
-            for attr in elem.attrib:
-                # Check if attribute is from a namespace other than allowed ones
-                if "{" in attr:
-                    ns = attr.split("}")[0][1:]
-                    if ns not in self.OOXML_NAMESPACES:
-                        attrs_to_remove.append(attr)
+    def _preprocess_for_xsd(self, xml_doc, clean_namespaces, owned=False):
+        """Prepare a parsed document for XSD validation in a single walk.
 
-            # Remove collected attributes
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
+        Three clean-ups are applied together:
+        - Template tags ({{ ... }} placeholders for content replacement) are
+          removed from text content, except inside w:t elements, while
+          preserving XML structure
+        - The mc:Ignorable attribute is removed from the root
+        - With clean_namespaces, attributes and elements outside the allowed
+          OOXML namespaces are removed
 
-        # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
-
-        return lxml.etree.ElementTree(xml_copy)
-
-    def _remove_ignorable_elements(self, root):
-        """Recursively remove all elements not in allowed namespaces."""
-        elements_to_remove = []
-
-        # Find elements to remove
-        for elem in list(root):
-            # Skip non-element nodes (comments, processing instructions, etc.)
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-
-            tag_str = str(elem.tag)
-            if tag_str.startswith("{"):
-                ns = tag_str.split("}")[0][1:]
-                if ns not in self.OOXML_NAMESPACES:
-                    elements_to_remove.append(elem)
-                    continue
-
-            # Recursively clean child elements
-            self._remove_ignorable_elements(elem)
-
-        # Remove collected elements
-        for elem in elements_to_remove:
-            root.remove(elem)
+        Args:
+            xml_doc: Parsed lxml ElementTree
+            clean_namespaces: Whether to remove non-OOXML namespaces
+            owned: Whether xml_doc may be modified in place; otherwise it is
+                left intact and a copy is cleaned
 
-    def _preprocess_for_mc_ignorable(self, xml_doc):
-        """Preprocess XML to handle mc:Ignorable attribute properly."""
-        # Remove mc:Ignorable attributes before validation
+        Returns:
+            lxml.etree._ElementTree: The cleaned document
+        """
         root = xml_doc.getroot()
+        if not owned:
+            root = copy.deepcopy(root)
 
         # Remove mc:Ignorable attribute from root
-        if f"{{{self.MC_NAMESPACE}}}Ignorable" in root.attrib:
-            del root.attrib[f"{{{self.MC_NAMESPACE}}}Ignorable"]
+        root.attrib.pop(f"{{{self.MC_NAMESPACE}}}Ignorable", None)
+
+        stack = [root]
+        while stack:
+            elem = stack.pop()
+
+            if clean_namespaces:
+                for attr in [a for a in elem.attrib if a.startswith("{")]:
+                    if attr[1:].split("}", 1)[0] not in self.OOXML_NAMESPACES:
+                        del elem.attrib[attr]
+
+            # Text of w:t elements is content and keeps its template tags
+            if not elem.tag.endswith("}t") and elem.tag != "t":
+                if elem.text and "{{" in elem.text:
+                    elem.text = _TEMPLATE_TAG_PATTERN.sub("", elem.text)
+                if elem.tail and "{{" in elem.tail:
+                    elem.tail = _TEMPLATE_TAG_PATTERN.sub("", elem.tail)
+
+            for child in list(elem):
+                # Skip non-element nodes (comments, processing instructions, etc.)
+                if not isinstance(child.tag, str):
+                    continue
+                if (
+                    clean_namespaces
+                    and child.tag.startswith("{")
+                    and child.tag[1:].split("}", 1)[0] not in self.OOXML_NAMESPACES
+                ):
+                    elem.remove(child)
+                    continue
+                stack.append(child)
 
-        return xml_doc
+        return lxml.etree.ElementTree(root)
 
     def _validate_single_file_xsd(self, xml_file, base_path):
         """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
@@ -830,28 +1114,29 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            xml_doc = self._parse_xml(xml_file)
+        except Exception as e:
+            return False, {str(e)}
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+        return self._validate_xml_doc_xsd(
+            xml_doc, xml_file.relative_to(base_path), schema_path
+        )
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+    def _validate_xml_doc_xsd(self, xml_doc, relative_path, schema_path, owned=False):
+        """Validate a parsed XML document against an XSD schema. Returns (is_valid, errors_set).
 
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+        With owned=True the document is preprocessed in place instead of on a copy.
+        """
+        try:
+            # Load schema (compiled once per process)
+            schema = _load_schema(str(schema_path))
+
+            # Preprocess XML, cleaning ignorable namespaces if needed
+            xml_doc = self._preprocess_for_xsd(
+                xml_doc,
+                clean_namespaces=self._cleans_namespaces(relative_path),
+                owned=owned,
+            )
 
             # Validate
             if schema.validate(xml_doc):
@@ -866,85 +1151,116 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    def _cleans_namespaces(self, relative_path):
+        """Return whether non-OOXML namespaces are removed before validation."""
+        return bool(
+            relative_path.parts and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+        )
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The original is read through the shared original_package view, so the
+        archive is opened once per run rather than extracted for every file.
+        Error sets are kept in a persistent cache (see errorcache.py) keyed by
+        the schema version and the part's SHA-256, so a template's parts are
+        validated once however many documents are generated from it.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        schema_path = self._get_schema_path(xml_file)
+        if not schema_path:
+            return set()
+
+        # Find corresponding file in original
+        content = self.original_package.read(relative_path.as_posix())
+        if content is None:
+            # File didn't exist in original, so no original errors
+            return set()
+
+        cache = open_error_cache()
+        if cache is not None:
+            schema_key = ":".join(
+                [
+                    schema_version(str(self.schemas_dir)),
+                    schema_path.relative_to(self.schemas_dir).as_posix(),
+                    str(self._cleans_namespaces(relative_path)),
+                ]
+            )
+            part_hash = hashlib.sha256(content).hexdigest()
+            cached = cache.get(schema_key, part_hash)
+            if cached is not None:
+                profiling.count("xsd_cache_hits")
+                return cached
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        # Validate the specific file in original
+        try:
+            xml_doc = lxml.etree.ElementTree(lxml.etree.fromstring(content))
+        except Exception as e:
+            errors = {str(e)}
+        else:
+            is_valid, errors = self._validate_xml_doc_xsd(
+                xml_doc, relative_path, schema_path, owned=True
+            )
+            errors = errors if errors else set()
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        if cache is not None:
+            cache.put(schema_key, part_hash, errors)
+        return errors
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+# Template tags ({{ ... }}) removed from text before XSD validation
+_TEMPLATE_TAG_PATTERN = re.compile(r"\{\{[^}]*\}\}")
 
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
-        """Remove template tags from XML text nodes and collect warnings.
+# Manifests of the last successful incremental validation, keyed by
+# (validator class, unpacked dir, original file, original size, original mtime)
+_validated_manifests = RunRecord()
 
-        Template tags follow the pattern {{ ... }} and are used as placeholders
-        for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
 
-        Returns:
-            tuple: (cleaned_xml_doc, warnings_list)
-        """
-        warnings = []
-        template_pattern = re.compile(r"\{\{[^}]*\}\}")
-
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        def process_text_content(text, content_type):
-            if not text:
-                return text
-            matches = list(template_pattern.finditer(text))
-            if matches:
-                for match in matches:
-                    warnings.append(
-                        f"Found template tag in {content_type}: {match.group()}"
-                    )
-                return template_pattern.sub("", text)
-            return text
+def _rels_source_part(rels_name):
+    """Return the part a .rels file describes (word/_rels/document.xml.rels ->
+    word/document.xml), or None for the package-level _rels/.rels."""
+    rels_dir, rels_file = posixpath.split(rels_name)
+    if posixpath.basename(rels_dir) != "_rels" or rels_file == ".rels":
+        return None
+    return posixpath.join(posixpath.dirname(rels_dir), rels_file[: -len(".rels")])
+
+
+# Validator owned by a pool worker process (see BaseSchemaValidator._map_files)
+_worker_validator = None
+
+
+def _init_worker(validator_class, unpacked_dir, original_file, source_dir):
+    global _worker_validator
+    _worker_validator = validator_class(
+        unpacked_dir, original_file, source_dir=source_dir
+    )
+
+
+def _call_in_worker(method_name, xml_file):
+    return getattr(_worker_validator, method_name)(xml_file)
 
-        # Process all text nodes in the document
-        for elem in xml_copy.iter():
-            # Skip processing if this is a w:t element
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-            tag_str = str(elem.tag)
-            if tag_str.endswith("}t") or tag_str == "t":
-                continue
 
-            elem.text = process_text_content(elem.text, "text content")
-            elem.tail = process_text_content(elem.tail, "tail content")
+@functools.cache
+def _load_schema(schema_path):
+    """Parse and compile an XSD schema, memoized per process by path.
 
-        return lxml.etree.ElementTree(xml_copy), warnings
+    The ISO/IEC 29500 schemas are large and compiling them dominates validation
+    time, so every validator instance in a process shares one compiled schema.
+    """
+    with open(schema_path, "rb") as xsd_file:
+        parser = lxml.etree.XMLParser()
+        xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=schema_path)
+        return lxml.etree.XMLSchema(xsd_doc)
 
 
 if __name__ == "__main__":
@@ -3,11 +3,10 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
+from . import profiling
 from .base import BaseSchemaValidator
 
 
@@ -67,21 +66,24 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         # Count and compare paragraphs
         self.compare_paragraph_counts()
 
+        if all_valid:
+            self.record_success()
         return all_valid
 
+    @profiling.timed()
     def validate_whitespace_preservation(self):
         """
         Validate that w:t elements with whitespace have xml:space='preserve'.
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.dirty_files:
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Find all w:t elements
                 for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
@@ -121,6 +123,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All whitespace is properly preserved")
             return True
 
+    @profiling.timed()
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
@@ -128,13 +131,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.dirty_files:
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Find all w:t elements that are descendants of w:del elements
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
@@ -180,39 +183,40 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+                # Count all w:p elements (reused if the part is unchanged)
+                count = self._part_fact(
+                    xml_file, "paragraphs", self._count_paragraphs_in_file
+                )
             except Exception as e:
                 print(f"Error counting paragraphs in unpacked document: {e}")
 
         return count
 
+    def _count_paragraphs_in_file(self, xml_file):
+        root = self._parse_xml(xml_file).getroot()
+        return len(root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p"))
+
     def count_paragraphs_in_original(self):
         """Count the number of paragraphs in the original docx file."""
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
+            # Parse document.xml from the shared original package
+            content = self.original_package.read("word/document.xml")
+            if content is None:
+                raise FileNotFoundError("word/document.xml not found")
+            root = lxml.etree.fromstring(content)
 
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
 
         return count
 
+    @profiling.timed()
     def validate_insertions(self):
         """
         Validate that w:delText elements are not within w:ins elements.
@@ -220,12 +224,12 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.dirty_files:
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 # Find w:delText in w:ins that are NOT within w:del
@@ -260,6 +264,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:delText elements within w:ins elements")
             return True
 
+    @profiling.timed()
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
         original_count = self.count_paragraphs_in_original()
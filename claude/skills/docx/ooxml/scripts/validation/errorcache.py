@@ -0,0 +1,121 @@
+"""
+Persistent cache of the XSD errors found in original document parts.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+# Bump when XSD preprocessing or error collection changes, so entries written
+# by older code are no longer matched
+CACHE_FORMAT = 1
+
+
+class SchemaErrorCache:
+    """SQLite store mapping (schema version, part SHA-256) to XSD error sets.
+
+    An original part's errors depend only on its bytes and on the schema used
+    to check them, so they are computed once and shared across runs and
+    processes. Any database problem (read-only disk, locked or corrupt file)
+    turns the cache off for this process; validation then simply recomputes.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._db = None
+        self._pid = None
+        self._disabled = False
+
+    def get(self, schema_key, part_hash):
+        """Return the cached error set, or None if it is not cached."""
+        row = self._execute(
+            "SELECT errors FROM xsd_errors WHERE schema_key = ? AND part_hash = ?",
+            (schema_key, part_hash),
+        )
+        if not row:
+            return None
+        return set(json.loads(row[0]))
+
+    def put(self, schema_key, part_hash, errors):
+        """Store the error set of a part."""
+        self._execute(
+            "INSERT OR REPLACE INTO xsd_errors VALUES (?, ?, ?)",
+            (schema_key, part_hash, json.dumps(sorted(errors))),
+            commit=True,
+        )
+
+    def _execute(self, sql, params, commit=False):
+        with self._lock:
+            if self._disabled:
+                return None
+            try:
+                db = self._connect()
+                row = db.execute(sql, params).fetchone()
+                if commit:
+                    db.commit()
+                return row
+            except (sqlite3.Error, OSError):
+                self._disabled = True
+                return None
+
+    def _connect(self):
+        # A connection must not be used across fork(), so pool workers that
+        # inherit one open their own
+        if self._db is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._pid = os.getpid()
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS xsd_errors ("
+                "schema_key TEXT, part_hash TEXT, errors TEXT, "
+                "PRIMARY KEY (schema_key, part_hash))"
+            )
+            self._db.commit()
+        return self._db
+
+
+def default_cache_path():
+    """Return the cache database path, or None if caching is turned off.
+
+    OOXML_XSD_CACHE names the database file; set it to an empty string to
+    turn the cache off. Otherwise the cache lives under $XDG_CACHE_HOME
+    (default ~/.cache).
+    """
+    path = os.environ.get("OOXML_XSD_CACHE")
+    if path is not None:
+        return Path(path) if path else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ooxml-validation" / "xsd-errors.sqlite3"
+
+
+def open_error_cache():
+    """Return the shared cache for this process, or None if caching is off."""
+    path = default_cache_path()
+    if path is None:
+        return None
+    return _open_error_cache(str(path))
+
+
+@functools.cache
+def _open_error_cache(path):
+    return SchemaErrorCache(path)
+
+
+@functools.cache
+def schema_version(schemas_dir):
+    """Return a digest of every schema file, so edited schemas miss the cache."""
+    schemas_dir = Path(schemas_dir)
+    digest = hashlib.sha256(str(CACHE_FORMAT).encode())
+    for path in sorted(p for p in schemas_dir.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(schemas_dir).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,328 @@
+"""
+Read-only views over packed or unpacked Office files used by the validators.
+"""
+
+import collections
+import fnmatch
+import functools
+import io
+import os
+import posixpath
+import threading
+import weakref
+import zipfile
+from pathlib import Path
+
+from . import profiling
+
+# Bytes of part content kept in memory across all package views. Views are
+# memoized for the life of the process, so without a bound a long-running
+# process would keep every package it validated.
+MEMBER_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class PackageManifest:
+    """Names and sizes of every part in a package, listed once.
+
+    Part names are normalized (forward slashes, no leading slash), so
+    membership tests and glob lookups are in-memory set and string
+    operations; checks that resolve references never touch the filesystem.
+    """
+
+    def __init__(self, sizes):
+        self.sizes = sizes  # part name -> size in bytes, in listing order
+        self.names = tuple(sizes)
+
+    def __contains__(self, name):
+        return normalize_part_name(name) in self.sizes
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def glob(self, pattern):
+        """Return the part names matching a glob pattern in one folder.
+
+        Like Path.glob() on an unpacked directory; "*" does not cross folders.
+        """
+        folder, name_pattern = posixpath.split(normalize_part_name(pattern))
+        return [
+            name
+            for name in self.names
+            if posixpath.dirname(name) == folder
+            and fnmatch.fnmatchcase(posixpath.basename(name), name_pattern)
+        ]
+
+
+class MemberCache:
+    """Part contents read from packages, bounded by their total size.
+
+    Shared by every package view; when the bound is exceeded the least
+    recently read parts are dropped, whichever view they belong to. A view's
+    parts are dropped when it is garbage collected.
+
+    Args:
+        max_bytes: Total size of the parts kept
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = collections.OrderedDict()  # (owner, name) -> bytes
+        self._lock = threading.Lock()
+
+    def get(self, owner, name):
+        """Return a cached part, or None."""
+        with self._lock:
+            content = self._entries.get((owner, name))
+            if content is not None:
+                self._entries.move_to_end((owner, name))
+            return content
+
+    def put(self, owner, name, content):
+        """Cache a part, dropping the least recently read ones to make room."""
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop((owner, name), None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[(owner, name)] = content
+            self.size += len(content)
+            while self.size > self.max_bytes:
+                _, dropped = self._entries.popitem(last=False)
+                self.size -= len(dropped)
+
+    def drop(self, owner):
+        """Forget every part cached for an owner."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] is owner]:
+                self.size -= len(self._entries.pop(key))
+
+
+_members = MemberCache(MEMBER_CACHE_BYTES)
+
+
+class _PackageView:
+    """Part reads served from the shared MemberCache, keyed per view."""
+
+    def __init__(self):
+        # A fresh token rather than id(self), which a later view may reuse
+        self._owner = object()
+        weakref.finalize(self, _members.drop, self._owner)
+
+    def _cached(self, name):
+        return _members.get(self._owner, name)
+
+    def _remember(self, name, content):
+        profiling.count("bytes_read", len(content))
+        _members.put(self._owner, name, content)
+        return content
+
+
+class ZipPackage(_PackageView):
+    """In-memory view of a packed Office file (.docx/.pptx/.xlsx).
+
+    The archive is opened once, and members read from it are kept in the
+    shared MemberCache, so they are usually decompressed once. Validators
+    share one instance per original file through open_package().
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path, "r")
+        self.manifest = PackageManifest(
+            {
+                info.filename: info.file_size
+                for info in self._zip.infolist()
+                if not info.is_dir()
+            }
+        )
+
+    def __contains__(self, name):
+        return name in self.manifest
+
+    def names(self):
+        """Return the part names in the archive, in central directory order."""
+        return list(self.manifest.names)
+
+    def read(self, name):
+        """Return the bytes of a part, or None if it is not in the archive."""
+        name = normalize_part_name(name)
+        if name not in self.manifest:
+            return None
+        content = self._cached(name)
+        if content is None:
+            content = self._remember(name, self._zip.read(name))
+        return content
+
+    def close(self):
+        """Close the archive; the view cannot read parts afterwards."""
+        self._zip.close()
+
+    def open(self, name):
+        """Return a binary stream over a part, or None if it is not in the archive.
+
+        Parts that have not been read are decompressed as the stream is read.
+        """
+        name = normalize_part_name(name)
+        if name not in self.manifest:
+            return None
+        content = self._cached(name)
+        if content is not None:
+            return io.BytesIO(content)
+        return self._zip.open(name)
+
+
+class DirectoryPackage(_PackageView):
+    """View of an unpacked Office document with the same interface as ZipPackage.
+
+    Lets an unpacked directory (such as the baseline snapshot kept by a
+    Document session) serve as the original without packing it first. The
+    directory is listed once, with a single scandir pass, and is assumed not
+    to change while the view is in use.
+    """
+
+    def __init__(self, path, entries=None):
+        super().__init__()
+        self.path = Path(path)
+        if entries is None:
+            entries = _scan_directory(self.path)
+        self.manifest = PackageManifest(
+            {name: size for name, (size, mtime_ns) in entries.items()}
+        )
+
+    def __contains__(self, name):
+        return name in self.manifest
+
+    def names(self):
+        """Return the part names in the directory, sorted."""
+        return list(self.manifest.names)
+
+    def read(self, name):
+        """Return the bytes of a part, or None if it is not in the directory."""
+        name = normalize_part_name(name)
+        if name not in self.manifest:
+            return None
+        content = self._cached(name)
+        if content is None:
+            content = self._remember(name, (self.path / name).read_bytes())
+        return content
+
+    def close(self):
+        """Nothing to release; parts are opened as they are read."""
+
+    def open(self, name):
+        """Return a binary stream over a part, or None if it is not in the directory."""
+        name = normalize_part_name(name)
+        if name not in self.manifest:
+            return None
+        content = self._cached(name)
+        if content is not None:
+            return io.BytesIO(content)
+        return open(self.path / name, "rb")
+
+
+class SessionPackage:
+    """View of a partial working tree over the unpacked folder it came from.
+
+    XML parts come from the working tree alone, so an XML part deleted there
+    is gone. Other parts (media, fonts, ...) come from the working tree if
+    they were written there, otherwise from the source folder. Used for
+    Document sessions, which copy non-XML parts only when they are written.
+    """
+
+    def __init__(self, path, source):
+        self.path = Path(path)
+        self._upper = DirectoryPackage(path)
+        self._lower = DirectoryPackage(source)
+        sizes = dict(self._upper.manifest.sizes)
+        for name, size in self._lower.manifest.sizes.items():
+            if name not in sizes and not is_xml_part(name):
+                sizes[name] = size
+        self.manifest = PackageManifest(dict(sorted(sizes.items())))
+
+    def __contains__(self, name):
+        return name in self.manifest
+
+    def names(self):
+        """Return the part names, sorted."""
+        return list(self.manifest.names)
+
+    def read(self, name):
+        """Return the bytes of a part, or None if it is in neither tree."""
+        name = normalize_part_name(name)
+        if name not in self.manifest:
+            return None
+        return self._view(name).read(name)
+
+    def open(self, name):
+        """Return a binary stream over a part, or None if it is in neither tree."""
+        name = normalize_part_name(name)
+        if name not in self.manifest:
+            return None
+        return self._view(name).open(name)
+
+    def close(self):
+        """Nothing to release; parts are opened as they are read."""
+
+    def _view(self, name):
+        return self._upper if name in self._upper.manifest else self._lower
+
+
+def is_xml_part(name):
+    """Check whether a part is XML (.xml or .rels), by its name."""
+    return str(name).lower().endswith((".xml", ".rels"))
+
+
+def normalize_part_name(name):
+    """Return a part name with forward slashes and no leading slash."""
+    return str(name).replace("\\", "/").lstrip("/")
+
+
+def _scan_directory(root):
+    """Return {part name: (size, mtime_ns)} for each file under root, sorted."""
+    parts = {}
+    folders = [""]
+    while folders:
+        prefix = folders.pop()
+        with os.scandir(os.path.join(root, prefix)) as entries:
+            for entry in entries:
+                name = prefix + entry.name
+                if entry.is_dir():
+                    folders.append(name + "/")
+                elif entry.is_file():
+                    stat = entry.stat()
+                    parts[name] = (stat.st_size, stat.st_mtime_ns)
+    return {name: parts[name] for name in sorted(parts)}
+
+
+def open_package(path):
+    """Return the shared package view for a packed file or unpacked directory.
+
+    Instances are memoized on the resolved path and the size and modification
+    time of the file, or of every file in the directory, so every validator in
+    a run reads the same package once while a rewritten file is picked up on
+    the next call. A part overwritten in place changes only its own mtime, so
+    a directory is listed again on each call.
+    """
+    path = Path(path).resolve()
+    if path.is_dir():
+        entries = _scan_directory(path)
+        return _open_package(str(path), tuple(entries.items()))
+    stat = path.stat()
+    return _open_package(str(path), (stat.st_size, stat.st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _open_package(path, signature):
+    if Path(path).is_dir():
+        return DirectoryPackage(path, dict(signature))
+    return ZipPackage(path)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
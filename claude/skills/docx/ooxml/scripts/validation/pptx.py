@@ -4,6 +4,7 @@ Validator for PowerPoint presentation XML files against XSD schemas.
 
 import re
 
+from . import profiling
 from .base import BaseSchemaValidator
 
 
@@ -72,8 +73,11 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         if not self.validate_no_duplicate_slide_layouts():
             all_valid = False
 
+        if all_valid:
+            self.record_success()
         return all_valid
 
+    @profiling.timed()
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
         import lxml.etree
@@ -84,9 +88,9 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
         )
 
-        for xml_file in self.xml_files:
+        for xml_file in self.dirty_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Check all elements for ID attributes
                 for elem in root.iter():
@@ -125,6 +129,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         # Check if it's 32 hex-like characters (could include invalid hex chars)
         return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
 
+    @profiling.timed()
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
         import lxml.etree
@@ -132,7 +137,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         # Find all slide master files
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        slide_masters = self._glob_parts("ppt/slideMasters/*.xml")
 
         if not slide_masters:
             if self.verbose:
@@ -142,12 +147,12 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self._parse_xml(slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
                 rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
 
-                if not rels_file.exists():
+                if self._part_name(rels_file) not in self.parts:
                     errors.append(
                         f"  {slide_master.relative_to(self.unpacked_dir)}: "
                         f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
@@ -155,7 +160,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     continue
 
                 # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Build a set of valid relationship IDs that point to slide layouts
                 valid_layout_rids = set()
@@ -200,16 +205,15 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slide layout IDs reference valid slide layouts")
             return True
 
+    @profiling.timed()
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = self._glob_parts("ppt/slides/_rels/*.xml.rels")
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all slideLayout relationships
                 layout_rels = [
@@ -240,6 +244,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slides have exactly one slideLayout reference")
             return True
 
+    @profiling.timed()
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
         import lxml.etree
@@ -248,7 +253,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = self._glob_parts("ppt/slides/_rels/*.xml.rels")
 
         if not slide_rels_files:
             if self.verbose:
@@ -258,7 +263,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for rels_file in slide_rels_files:
             try:
                 # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all notesSlide relationships
                 for rel in root.findall(
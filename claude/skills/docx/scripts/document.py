@@ -8,6 +8,7 @@ Usage:
     # Initialize
     doc = Document('workspace/unpacked')
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/unpacked', backend="lxml")  # Faster on large documents
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
@@ -26,23 +27,33 @@ Usage:
     doc.save()
 """
 
+import copy
 import html
+import os
 import random
 import shutil
 import tempfile
-from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
+from ooxml.scripts.validation import profiling
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
+from ooxml.scripts.validation.memo import forget_runs
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import IdAllocator, LxmlXMLEditor, XMLEditor
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Clark notation prefix for WordprocessingML element names
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -56,6 +67,24 @@ class DocxXMLEditor(XMLEditor):
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
     """
 
+    EDIT_OPERATIONS = {
+        **XMLEditor.EDIT_OPERATIONS,
+        "suggest_deletion": False,
+        "revert_insertion": False,
+        "revert_deletion": False,
+    }
+
+    # Tags that get attributes injected, in the order they are processed
+    _INJECTED_TAGS = (
+        "w:p",
+        "w:r",
+        "w:t",
+        "w:ins",
+        "w:del",
+        "w:comment",
+        "w16cex:commentExtensible",
+    )
+
     def __init__(
         self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
     ):
@@ -71,47 +100,92 @@ class DocxXMLEditor(XMLEditor):
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self._change_ids = None  # Built on first use, then maintained
+        self._change_ids_stale = False
+        self._pending_injection = None  # Nodes collected during apply_edits()
+
+    def apply_edits(self, edits):
+        """Apply a sequence of edits in one pass; see XMLEditor.apply_edits().
+
+        Besides the XMLEditor operations, edits may use suggest_deletion,
+        revert_insertion and revert_deletion (these take no "xml"). Attribute
+        injection for all inserted nodes runs once, after the last edit.
+
+        Example:
+            with open("edits.json") as f:
+                doc["word/document.xml"].apply_edits(json.load(f))
+        """
+        self._pending_injection = []
+        try:
+            return super().apply_edits(edits)
+        finally:
+            nodes, self._pending_injection = self._pending_injection, None
+            self._inject_attributes_to_nodes(nodes)
+
+    def _forget_lookups(self):
+        super()._forget_lookups()
+        # Direct edits may have added tracked changes with their own IDs
+        self._change_ids_stale = True
+
+    def _nodes_inserted(self, parent, nodes):
+        super()._nodes_inserted(parent, nodes)
+        # Nodes inserted through the DOM may carry tracked-change IDs
+        if self._change_ids is not None:
+            self._change_ids.note_all(
+                elem.getAttribute("w:id")
+                for node in nodes
+                if node.nodeType == node.ELEMENT_NODE
+                for elem in self._subtree(node)
+                if elem.tagName in ("w:ins", "w:del")
+            )
+
+    def _attributes_changed(self, elem):
+        super()._attributes_changed(elem)
+        if self._change_ids is not None and elem.tagName in ("w:ins", "w:del"):
+            self._change_ids.note(elem.getAttribute("w:id"))
+
+    @property
+    def change_ids(self):
+        """IdAllocator for w:ins/w:del IDs in this part.
+
+        Built from a single scan of the part on first use and advanced by
+        every allocation and by IDs found on inserted content. Reserve blocks
+        with change_ids.reserve(n) to build tracked changes elsewhere.
+        """
+        if self._change_ids is None or self._change_ids_stale:
+            existing = [
+                elem.getAttribute("w:id")
+                for tag in ("w:ins", "w:del")
+                for elem in self._dom.getElementsByTagName(tag)
+            ]
+            if self._change_ids is None:
+                self._change_ids = IdAllocator(existing)
+            else:
+                self._change_ids.note_all(existing)
+            self._change_ids_stale = False
+        return self._change_ids
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next available change ID."""
+        return self.change_ids.allocate()
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._ensure_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._ensure_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._ensure_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -124,9 +198,16 @@ class DocxXMLEditor(XMLEditor):
         - w:comment: gets w:author, w:date, w:initials
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
+        Each node's subtree is walked once. During apply_edits() the nodes are
+        collected and processed together when the batch ends.
+
         Args:
             nodes: List of DOM nodes to process
         """
+        if self._pending_injection is not None:
+            self._pending_injection.extend(nodes)
+            return
+
         from datetime import datetime, timezone
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -195,47 +276,52 @@ class DocxXMLEditor(XMLEditor):
 
         def add_xml_space_to_t(elem):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
-                if text and (text[0].isspace() or text[-1].isspace()):
-                    if not elem.hasAttribute("xml:space"):
-                        elem.setAttribute("xml:space", "preserve")
-
+            text = self._first_text(elem)
+            if text and (text[0].isspace() or text[-1].isspace()):
+                if not elem.hasAttribute("xml:space"):
+                    elem.setAttribute("xml:space", "preserve")
+
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:r": add_rsid_to_r,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+
+        # One walk per node collects its descendants by tag
+        walks = []
         for node in nodes:
             if node.nodeType != node.ELEMENT_NODE:
                 continue
+            by_tag = {tag: [] for tag in self._INJECTED_TAGS}
+            for elem in self._subtree(node):
+                matches = by_tag.get(elem.tagName)
+                if matches is not None:
+                    matches.append(elem)
+            walks.append((node, by_tag))
+
+        # Keep the change ID allocator past IDs the new content already uses
+        if self._change_ids is not None:
+            self._change_ids.note_all(
+                elem.getAttribute("w:id")
+                for node, by_tag in walks
+                for elem in by_tag["w:ins"] + by_tag["w:del"]
+            )
+
+        # Handle each node itself, then its descendants grouped by tag
+        for node, by_tag in walks:
+            handler = handlers.get(node.tagName)
+            if handler:
+                handler(node)
+            for tag, elems in by_tag.items():
+                for elem in elems:
+                    if elem is not node:
+                        handlers[tag](elem)
 
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+        self._reindex(nodes)
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -306,7 +392,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
 
             # Process each run
             for run in runs:
@@ -318,7 +404,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
                 for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
+                    del_text = self._dom.createElement("w:delText")
                     # Copy ALL child nodes (not just firstChild) to handle entities
                     while t_elem.firstChild:
                         del_text.appendChild(t_elem.firstChild)
@@ -391,7 +477,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
+            ins_elem = self._dom.createElement("w:ins")
 
             for run in runs:
                 # Clone the run
@@ -399,7 +485,7 @@ class DocxXMLEditor(XMLEditor):
 
                 # Convert w:delText → w:t
                 for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
+                    t_elem = self._dom.createElement("w:t")
                     # Copy ALL child nodes (not just firstChild) to handle entities
                     while del_text.firstChild:
                         t_elem.appendChild(del_text.firstChild)
@@ -502,7 +588,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -520,7 +606,7 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             parent = elem.parentNode
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
@@ -546,20 +632,21 @@ class DocxXMLEditor(XMLEditor):
                 rPr_list = pPr.getElementsByTagName("w:rPr")
 
                 if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
+                    rPr = self._dom.createElement("w:rPr")
                     pPr.appendChild(rPr)
                 else:
                     rPr = rPr_list[0]
 
                 # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
+                del_marker = self._dom.createElement("w:del")
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
+                self._reindex([rPr])
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -578,7 +665,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
                 elem.removeChild(child)
                 del_wrapper.appendChild(child)
@@ -593,6 +680,216 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class LxmlDocxXMLEditor(DocxXMLEditor, LxmlXMLEditor):
+    """DocxXMLEditor on an lxml tree; see LxmlXMLEditor.
+
+    Attribute injection is shared with DocxXMLEditor. The tracked-change
+    helpers are reimplemented with lxml operations: w:t and w:delText are
+    converted by renaming the element in place, which keeps its attributes
+    and content.
+    """
+
+    def revert_insertion(self, elem):
+        """Reject an insertion by wrapping its content in a deletion.
+
+        See DocxXMLEditor.revert_insertion().
+        """
+        if elem.tag == f"{_W}ins":
+            ins_elements = [elem]
+        else:
+            ins_elements = list(elem.iterdescendants(f"{_W}ins"))
+
+        if not ins_elements:
+            raise ValueError(
+                f"revert_insertion requires w:ins elements. "
+                f"The provided element <{elem.tagName}> contains no insertions. "
+            )
+
+        for ins_elem in ins_elements:
+            runs = list(ins_elem.iterdescendants(f"{_W}r"))
+            if not runs:
+                continue
+
+            for run in runs:
+                self._mark_run_deleted(run)
+
+            # Move all content from ins to a del wrapper inside it
+            del_wrapper = self._parser.makeelement(f"{_W}del")
+            del_wrapper.text, ins_elem.text = ins_elem.text, None
+            del_wrapper.extend(list(ins_elem))
+            ins_elem.append(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+
+        return [elem]
+
+    def revert_deletion(self, elem):
+        """Reject a deletion by re-inserting the deleted content.
+
+        See DocxXMLEditor.revert_deletion().
+        """
+        is_single_del = elem.tag == f"{_W}del"
+        if is_single_del:
+            del_elements = [elem]
+        else:
+            del_elements = list(elem.iterdescendants(f"{_W}del"))
+
+        if not del_elements:
+            raise ValueError(
+                f"revert_deletion requires w:del elements. "
+                f"The provided element <{elem.tagName}> contains no deletions. "
+            )
+
+        created_insertion = None
+        for del_elem in del_elements:
+            runs = list(del_elem.iterdescendants(f"{_W}r"))
+            if not runs:
+                continue
+
+            ins_elem = self._parser.makeelement(f"{_W}ins")
+            for run in runs:
+                new_run = copy.deepcopy(run)
+                new_run.tail = None
+                for node in new_run.iter():
+                    # Copies are new content, not positions in the original file
+                    node.sourceline = 0
+                for del_text in list(new_run.iter(f"{_W}delText")):
+                    del_text.tag = f"{_W}t"
+
+                # Update run attributes: w:rsidDel → w:rsidR
+                if new_run.hasAttribute("w:rsidDel"):
+                    new_run.setAttribute("w:rsidR", new_run.getAttribute("w:rsidDel"))
+                    new_run.removeAttribute("w:rsidDel")
+                elif not new_run.hasAttribute("w:rsidR"):
+                    new_run.setAttribute("w:rsidR", self.rsid)
+
+                ins_elem.append(new_run)
+
+            # Insert the new insertion after the deletion
+            del_elem.addnext(ins_elem)
+            self._reindex([ins_elem])
+            self._inject_attributes_to_nodes([ins_elem])
+
+            if is_single_del:
+                created_insertion = ins_elem
+
+        if is_single_del and created_insertion is not None:
+            return [elem, created_insertion]
+        return [elem]
+
+    def suggest_deletion(self, elem):
+        """Mark a w:r or w:p element as deleted with tracked changes.
+
+        See DocxXMLEditor.suggest_deletion().
+        """
+        if elem.tag == f"{_W}r":
+            if any(True for _ in elem.iterdescendants(f"{_W}delText")):
+                raise ValueError("w:r element already contains w:delText")
+
+            self._mark_run_deleted(elem)
+
+            # Wrap in w:del, keeping the run's trailing whitespace outside
+            del_wrapper = self._parser.makeelement(f"{_W}del")
+            del_wrapper.tail, elem.tail = elem.tail, None
+            elem.addprevious(del_wrapper)
+            del_wrapper.append(elem)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return del_wrapper
+
+        elif elem.tag == f"{_W}p":
+            if any(True for _ in elem.iterdescendants(f"{_W}ins", f"{_W}del")):
+                raise ValueError("w:p element already contains tracked changes")
+
+            # Numbered list items also get <w:del/> in the paragraph mark's w:rPr
+            pPr = next(elem.iterdescendants(f"{_W}pPr"), None)
+            if pPr is not None and next(pPr.iterdescendants(f"{_W}numPr"), None):
+                rPr = next(pPr.iterdescendants(f"{_W}rPr"), None)
+                if rPr is None:
+                    rPr = self._parser.makeelement(f"{_W}rPr")
+                    pPr.append(rPr)
+                rPr.insert(0, self._parser.makeelement(f"{_W}del"))
+                self._reindex([rPr])
+
+            for run in elem.iterdescendants(f"{_W}r"):
+                self._mark_run_deleted(run)
+
+            # Wrap all non-pPr children in <w:del>
+            del_wrapper = self._parser.makeelement(f"{_W}del")
+            del_wrapper.extend([c for c in elem if c.tag != f"{_W}pPr"])
+            elem.append(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return elem
+
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
+
+    def _mark_run_deleted(self, run):
+        """Convert a run's w:t to w:delText and w:rsidR to w:rsidDel."""
+        for t_elem in list(run.iterdescendants(f"{_W}t")):
+            t_elem.tag = f"{_W}delText"
+
+        if run.hasAttribute("w:rsidR"):
+            run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
+            run.removeAttribute("w:rsidR")
+        elif not run.hasAttribute("w:rsidDel"):
+            run.setAttribute("w:rsidDel", self.rsid)
+
+
+# XML parts: read by the validators, and the only parts a session copies up front
+XML_SUFFIXES = (".xml", ".rels")
+
+# Linux ioctl cloning a whole file into another on copy-on-write filesystems
+FICLONE = 0x40049409
+
+
+def _snapshot_tree(src, dst):
+    """Copy the XML parts of a directory tree, cloning them where supported."""
+
+    def other_parts(directory, names):
+        return [
+            name
+            for name in names
+            if not name.lower().endswith(XML_SUFFIXES)
+            and not os.path.isdir(os.path.join(directory, name))
+        ]
+
+    shutil.copytree(src, dst, ignore=other_parts, copy_function=_clone_file)
+
+
+def _clone_file(src, dst):
+    """Copy a file as a copy-on-write clone (reflink), or in full if unsupported."""
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as source, open(dst, "wb") as target:
+                fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+
+def _scan_parts(root):
+    """Return {relative path: (size, mtime_ns)} for every file under root."""
+    parts = {}
+    for path in root.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            parts[path.relative_to(root)] = (stat.st_size, stat.st_mtime_ns)
+    return parts
+
+
+def _replace_file(src, dst):
+    """Copy src over dst by replacing it, so other links to dst keep their data."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = dst.with_name(dst.name + ".tmp")
+    shutil.copy2(src, temp_path)
+    os.replace(temp_path, dst)
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -619,6 +916,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        backend="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,20 +928,32 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            backend: "minidom" (default) or "lxml". With "lxml", word/document.xml is
+                edited through LxmlDocxXMLEditor, which parses and searches large
+                documents much faster; other parts stay on minidom.
         """
+        if backend not in ("minidom", "lxml"):
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # The validation baseline and the working tree each start as a
+        # snapshot of the original XML parts (cloned where the filesystem
+        # supports it), so writing to the working tree never reaches the
+        # original or the baseline. Other parts (media, fonts, ...) are read
+        # from the original folder and only exist in the working tree once
+        # written there. Copies keep their mtime, so the sizes and mtimes
+        # recorded here tell which parts were written during the session.
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
+        self.baseline_path = Path(self.temp_dir) / "original"
+        _snapshot_tree(self.original_path, self.baseline_path)
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
-
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        _snapshot_tree(self.original_path, self.unpacked_path)
+        self._initial_parts = _scan_parts(self.unpacked_path)
 
         self.word_path = self.unpacked_path / "word"
 
@@ -664,9 +974,8 @@ class Document:
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
-        # Load existing comments and determine next ID (before setup modifies files)
-        self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
+        # Load existing comments and comment IDs (before setup modifies files)
+        self.existing_comments, self.comment_ids = self._load_existing_comments()
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -688,7 +997,8 @@ class Document:
             xml_path: Relative path to XML file (e.g., "word/document.xml", "word/comments.xml")
 
         Returns:
-            DocxXMLEditor instance for the specified file
+            DocxXMLEditor instance for the specified file (LxmlDocxXMLEditor for
+            word/document.xml when backend="lxml")
 
         Raises:
             ValueError: If the file does not exist
@@ -705,11 +1015,27 @@ class Document:
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
-            )
+            editor_class = DocxXMLEditor
+            if self.backend == "lxml" and xml_path == "word/document.xml":
+                editor_class = LxmlDocxXMLEditor
+            with profiling.span("load_editor", "document", part=xml_path):
+                self._editors[xml_path] = editor_class(
+                    file_path,
+                    rsid=self.rsid,
+                    author=self.author,
+                    initials=self.initials,
+                )
         return self._editors[xml_path]
 
+    @property
+    def next_comment_id(self) -> int:
+        """The comment ID the next add_comment() or reply_to_comment() will use.
+
+        IDs come from comment_ids, an IdAllocator; use comment_ids.reserve(n)
+        to set aside IDs for comments built elsewhere.
+        """
+        return self.comment_ids.next_id
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -727,40 +1053,85 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return self.add_comments([{"start": start, "end": end, "text": text}])[0]
 
-        # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
+    def add_comments(self, comments) -> list[int]:
+        """
+        Add many comments at once.
 
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
+        Works like calling add_comment() for each entry, but the comment ranges
+        are inserted into document.xml as one apply_edits() batch and each
+        comment part gets a single append holding all of the new entries.
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        Args:
+            comments: Iterable of dicts with "start" and "end" (DOM elements)
+                and "text", as for add_comment()
 
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
+        Returns:
+            list[int]: The comment IDs that were created, in order
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        Example:
+            doc.add_comments([
+                {"start": para, "end": para, "text": "Define this term"},
+                {"start": run, "end": run, "text": "Check the figure"},
+            ])
+        """
+        # Read every entry before reserving IDs or touching any part
+        comments = [
+            (comment["start"], comment["end"], comment["text"]) for comment in comments
+        ]
+        if not comments:
+            return []
+        comment_ids = self.comment_ids.reserve(len(comments))
+
+        edits = []
+        new_comments = []
+        for comment_id, (start, end, text) in zip(comment_ids, comments):
+            edits.append(
+                {
+                    "op": "insert_before",
+                    "target": start,
+                    "xml": self._comment_range_start_xml(comment_id),
+                }
+            )
+            # If end node is a paragraph, append comment markup inside it
+            # Otherwise insert after it (for run-level anchors)
+            edits.append(
+                {
+                    "op": "append_to" if end.tagName == "w:p" else "insert_after",
+                    "target": end,
+                    "xml": self._comment_range_end_xml(comment_id),
+                }
+            )
+            new_comments.append(
+                (comment_id, _generate_hex_id(), _generate_hex_id(), text)
+            )
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        # Add comment ranges to document.xml in one batch
+        self._document.apply_edits(edits)
+
+        # Add all comments to each comment part in one append
+        self._add_to_comments_xml(
+            [
+                (comment_id, para_id, text)
+                for comment_id, para_id, _, text in new_comments
+            ]
+        )
+        self._add_to_comments_extended_xml(
+            [(para_id, None) for _, para_id, _, _ in new_comments]
+        )
+        self._add_to_comments_ids_xml(
+            [(para_id, durable_id) for _, para_id, durable_id, _ in new_comments]
+        )
+        self._add_to_comments_extensible_xml(
+            [durable_id for _, _, durable_id, _ in new_comments]
+        )
 
         # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        for comment_id, para_id, _, _ in new_comments:
+            self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
-        return comment_id
+        return list(comment_ids)
 
     def reply_to_comment(
         self,
@@ -784,10 +1155,9 @@ class Document:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
 
         parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
+        comment_id = self.comment_ids.allocate()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
         parent_start_elem = self._document.get_node(
@@ -809,110 +1179,156 @@ class Document:
         )
 
         # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        self._add_to_comments_xml([(comment_id, para_id, text)])
 
         # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
-        )
+        self._add_to_comments_extended_xml([(para_id, parent_info["para_id"])])
 
         # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        self._add_to_comments_ids_xml([(para_id, durable_id)])
 
         # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        self._add_to_comments_extensible_xml([durable_id])
 
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
-    def __del__(self):
-        """Clean up temporary directory on deletion."""
+    def close(self):
+        """Remove the session's temporary directory; unsaved changes are lost."""
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
+            # Drop the validation runs recorded for the working tree too
+            forget_runs(self.unpacked_path)
             shutil.rmtree(self.temp_dir)
 
+    def __del__(self):
+        """Clean up temporary directory on deletion."""
+        self.close()
+
     def validate(self) -> None:
         """
         Validate the document against XSD schema and redlining rules.
 
+        Unsaved edits are written to the session's working copy first, so
+        the document is checked as it currently stands. Validation is
+        incremental: parts that are byte-identical to the last successful
+        validation in this session are not checked again.
+
         Raises:
             ValueError: If validation fails.
         """
+        self._write_pending_changes()
+
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.baseline_path,
+            verbose=False,
+            incremental=True,
+            source_dir=self.original_path,
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.baseline_path,
+            verbose=False,
+            incremental=True,
+            author=self.author,
         )
 
         # Run validations
-        if not schema_validator.validate():
-            raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+        try:
+            with profiling.span("schema_validation", "document"):
+                schema_valid = schema_validator.validate()
+            if not schema_valid:
+                raise ValueError("Schema validation failed")
+            with profiling.span("redlining_validation", "document"):
+                redlining_valid = redlining_validator.validate()
+            if not redlining_valid:
+                raise ValueError("Redlining validation failed")
+        finally:
+            schema_validator.close()
+            redlining_validator.close()
 
     def save(self, destination=None, validate=True) -> None:
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only editors that may have unsaved changes are serialized. When
+        saving back to the original directory, only parts that were replaced
+        or added during the session are written; when saving elsewhere, the
+        original's non-XML parts that were never written to unpacked_path are
+        copied from the original directory. XML parts deleted from
+        unpacked_path during the session are deleted from the destination.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
-        # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
-            self._ensure_comment_relationships()
-            self._ensure_comment_content_types()
-
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
-
-        # Validate by default
+        # Validate by default; validation writes pending changes itself
         if validate:
             self.validate()
+        else:
+            self._write_pending_changes()
 
         # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
-
-    # ==================== Private: Initialization ====================
+        changed_only = target_path.resolve() == self.original_path.resolve()
+        with profiling.span("copy_parts", "document"):
+            parts = _scan_parts(self.unpacked_path)
+            for relative_path, signature in parts.items():
+                if changed_only and self._initial_parts.get(relative_path) == signature:
+                    continue
+                _replace_file(
+                    self.unpacked_path / relative_path, target_path / relative_path
+                )
+            for relative_path in self._initial_parts.keys() - parts.keys():
+                (target_path / relative_path).unlink(missing_ok=True)
+            if not changed_only:
+                for relative_path in (
+                    _scan_parts(self.original_path).keys() - parts.keys()
+                ):
+                    if not str(relative_path).lower().endswith(XML_SUFFIXES):
+                        _replace_file(
+                            self.original_path / relative_path,
+                            target_path / relative_path,
+                        )
+
+    def _write_pending_changes(self):
+        """Write modified XML files to the working copy in the temp directory."""
+        # Only ensure comment relationships and content types if comment files exist
+        if self.comments_path.exists():
+            self._ensure_comment_relationships()
+            self._ensure_comment_content_types()
 
-    def _get_next_comment_id(self):
-        """Get the next available comment ID."""
-        if not self.comments_path.exists():
-            return 0
+        # Editors with tracked edits, or whose nodes were handed out for direct
+        # edits, are serialized; a part is written only if it changed
+        with profiling.span("save_editors", "document"):
+            for editor in self._editors.values():
+                editor.save_if_changed()
 
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+    # ==================== Private: Initialization ====================
 
     def _load_existing_comments(self):
-        """Load existing comments from files to enable replies."""
+        """Load existing comments from files to enable replies.
+
+        Returns:
+            tuple: (dict of comment ID -> {"para_id": ...}, IdAllocator for
+            comment IDs), both built from a single walk of comments.xml
+        """
         if not self.comments_path.exists():
-            return {}
+            return {}, IdAllocator()
 
         editor = self["word/comments.xml"]
         existing = {}
+        comment_ids = []
 
         for comment_elem in editor.dom.getElementsByTagName("w:comment"):
             comment_id = comment_elem.getAttribute("w:id")
             if not comment_id:
                 continue
+            comment_ids.append(comment_id)
 
             # Find para_id from the w:p element within the comment
             para_id = None
@@ -926,7 +1342,7 @@ class Document:
 
             existing[int(comment_id)] = {"para_id": para_id}
 
-        return existing
+        return existing, IdAllocator(comment_ids)
 
     # ==================== Private: Setup Methods ====================
 
@@ -1065,31 +1481,38 @@ class Document:
 
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
+    def _add_to_comments_xml(self, comments):
+        """Append comments to comments.xml in one operation.
+
+        Args:
+            comments: List of (comment_id, para_id, text) tuples
+        """
         if not self.comments_path.exists():
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        )
         # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
         # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
+        comment_xml = "".join(
+            f'''<w:comment w:id="{comment_id}">
   <w:p w14:paraId="{para_id}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
-    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
+    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{html.escape(text, quote=False)}</w:t></w:r>
   </w:p>
 </w:comment>'''
+            for comment_id, para_id, text in comments
+        )
         editor.append_to(root, comment_xml)
 
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
+    def _add_to_comments_extended_xml(self, entries):
+        """Append comments to commentsExtended.xml in one operation.
+
+        Args:
+            entries: List of (para_id, parent_para_id) tuples; parent_para_id
+                is None for top-level comments
+        """
         if not self.comments_extended_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
@@ -1098,25 +1521,40 @@ class Document:
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
 
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+        xml = []
+        for para_id, parent_para_id in entries:
+            if parent_para_id:
+                xml.append(
+                    f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+                )
+            else:
+                xml.append(f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>')
+        editor.append_to(root, "".join(xml))
+
+    def _add_to_comments_ids_xml(self, entries):
+        """Append comments to commentsIds.xml in one operation.
 
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
+        Args:
+            entries: List of (para_id, durable_id) tuples
+        """
         if not self.comments_ids_path.exists():
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+            for para_id, durable_id in entries
+        )
         editor.append_to(root, xml)
 
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
+    def _add_to_comments_extensible_xml(self, durable_ids):
+        """Append comments to commentsExtensible.xml in one operation.
+
+        Args:
+            durable_ids: List of durable IDs
+        """
         if not self.comments_extensible_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
@@ -1125,7 +1563,10 @@ class Document:
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+            for durable_id in durable_ids
+        )
         editor.append_to(root, xml)
 
     # ==================== Private: XML Fragments ====================
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Long-lived JSON-RPC service holding Document sessions.
+
+Running every edit as its own Python process pays for interpreter startup,
+imports, parsing the document and compiling the XSD schemas each time. The
+service pays them once: sessions stay open between calls, and compiled
+schemas and cached original-part errors are reused by every validation.
+
+Usage:
+    PYTHONPATH=/mnt/skills/docx python -m scripts.service                # stdio
+    PYTHONPATH=/mnt/skills/docx python -m scripts.service --socket /tmp/docx.sock
+
+Protocol: JSON-RPC 2.0, one JSON object per line. Requests are handled one at
+a time, in order, across all clients. Nodes are addressed with get_node()
+arguments ({"tag": "w:r", "contains": "old"}; a two-item line_number list is
+a range) and returned as {"tag", "line", "xml"}.
+
+Methods:
+    open(path, author?, initials?, rsid?, track_revisions?, backend?)
+        -> {"session", "rsid"}
+    get_node(session, tag, attrs?, line_number?, contains?, part?) -> node
+    edit(session, edits, part?) -> one result per edit (see apply_edits())
+    comment(session, start, end?, text) -> {"id"}
+    reply(session, parent, text) -> {"id"}
+    validate(session) -> {"valid", "output"}
+    save(session, destination?, validate?) -> {"saved"}
+    close(session) -> {"closed"}
+    validate_package(path, original) -> {"valid", "output"}  (.docx or .pptx)
+    pack(directory, output, validate?) -> {"packed", "valid", "output"}
+    shutdown() -> {"shutdown"}  (closes every session; unsaved changes are lost)
+
+pack validates the packed file on the shared pool of warm soffice instances
+(ooxml/scripts/soffice_pool.py), which a long-lived service keeps running
+between calls; the file is deleted if validation fails.
+
+part defaults to "word/document.xml". Failures are returned as JSON-RPC
+errors whose data holds any output the library printed.
+
+Example client:
+    with ServiceClient("/tmp/docx.sock") as client:
+        session = client.call("open", path="unpacked")["session"]
+        client.call("edit", session=session, edits=[
+            {"op": "suggest_deletion", "target": {"tag": "w:r", "contains": "old"}},
+        ])
+        client.call("save", session=session)
+"""
+
+import argparse
+import contextlib
+import inspect
+import io
+import itertools
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+
+from ooxml.scripts.pack import pack_document
+from ooxml.scripts.validation import (
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
+
+from .document import Document
+
+DEFAULT_PART = "word/document.xml"
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class ServiceError(Exception):
+    """A request failed; sent to the client as a JSON-RPC error."""
+
+    def __init__(self, code, message, data=None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class DocumentService:
+    """Open Document sessions and the RPC methods that act on them."""
+
+    def __init__(self):
+        self.sessions = {}
+        self._next_id = itertools.count(1)
+        self._lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def handle(self, line):
+        """Handle one request line and return the response line, or None.
+
+        Notifications (requests without an id) get no response.
+        """
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return _error_response(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error_response(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        try:
+            result = self.dispatch(request["method"], request.get("params") or {})
+        except ServiceError as e:
+            response = _error_response(request_id, e.code, str(e), e.data)
+        else:
+            response = json.dumps(
+                {"jsonrpc": "2.0", "id": request_id, "result": result}
+            )
+        return None if "id" not in request else response
+
+    def dispatch(self, method, params):
+        """Call an RPC method with its params; raise ServiceError on failure."""
+        handler = getattr(self, f"rpc_{method}", None)
+        if handler is None:
+            raise ServiceError(METHOD_NOT_FOUND, f"Method not found: {method}")
+        if not isinstance(params, dict):
+            raise ServiceError(INVALID_PARAMS, "params must be an object")
+
+        try:
+            inspect.signature(handler).bind(**params)
+        except TypeError as e:
+            raise ServiceError(INVALID_PARAMS, str(e)) from e
+
+        # The library reports details on stdout, which may be the RPC channel
+        output = io.StringIO()
+        with self._lock, contextlib.redirect_stdout(output):
+            try:
+                return handler(**params)
+            except ServiceError:
+                raise
+            except Exception as e:
+                raise ServiceError(
+                    SERVER_ERROR,
+                    f"{type(e).__name__}: {e}",
+                    {"output": output.getvalue()},
+                ) from e
+
+    def _session(self, session):
+        try:
+            return self.sessions[session]
+        except KeyError:
+            raise ServiceError(INVALID_PARAMS, f"Unknown session: {session}")
+
+    def rpc_open(
+        self,
+        path,
+        author="Claude",
+        initials="C",
+        rsid=None,
+        track_revisions=False,
+        backend="minidom",
+    ):
+        doc = Document(
+            path,
+            rsid=rsid,
+            track_revisions=track_revisions,
+            author=author,
+            initials=initials,
+            backend=backend,
+        )
+        session = next(self._next_id)
+        self.sessions[session] = doc
+        return {"session": session, "rsid": doc.rsid}
+
+    def rpc_get_node(self, session, part=DEFAULT_PART, **query):
+        editor = self._session(session)[part]
+        return _node_result(editor.get_node(**_node_query(query)))
+
+    def rpc_edit(self, session, edits, part=DEFAULT_PART):
+        editor = self._session(session)[part]
+        return [_edit_result(result) for result in editor.apply_edits(edits)]
+
+    def rpc_comment(self, session, start, text, end=None):
+        doc = self._session(session)
+        editor = doc[DEFAULT_PART]
+        start_node = editor.get_node(**_node_query(start))
+        end_node = editor.get_node(**_node_query(end)) if end else start_node
+        return {"id": doc.add_comment(start=start_node, end=end_node, text=text)}
+
+    def rpc_reply(self, session, parent, text):
+        doc = self._session(session)
+        return {"id": doc.reply_to_comment(parent_comment_id=parent, text=text)}
+
+    def rpc_validate(self, session):
+        doc = self._session(session)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            try:
+                doc.validate()
+                valid = True
+            except ValueError:
+                valid = False
+        return {"valid": valid, "output": output.getvalue()}
+
+    def rpc_save(self, session, destination=None, validate=True):
+        doc = self._session(session)
+        doc.save(destination, validate=validate)
+        return {"saved": str(destination or doc.original_path)}
+
+    def rpc_close(self, session):
+        self._session(session).close()
+        del self.sessions[session]
+        return {"closed": session}
+
+    def rpc_validate_package(self, path, original):
+        match Path(original).suffix.lower():
+            case ".docx":
+                validators = [DOCXSchemaValidator, RedliningValidator]
+            case ".pptx":
+                validators = [PPTXSchemaValidator]
+            case suffix:
+                raise ServiceError(INVALID_PARAMS, f"Unsupported file type {suffix}")
+        valid = True
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            for V in validators:
+                validator = V(path, original, incremental=True)
+                try:
+                    valid = validator.validate() and valid
+                finally:
+                    validator.close()
+        return {"valid": valid, "output": output.getvalue()}
+
+    def rpc_pack(self, directory, output, validate=True):
+        # soffice reports problems on stderr, so capture it with stdout
+        with contextlib.redirect_stdout(io.StringIO()) as output_text:
+            with contextlib.redirect_stderr(output_text):
+                valid = pack_document(
+                    directory, output, validate=validate, use_pool=True
+                )
+        return {
+            "packed": str(output) if valid else None,
+            "valid": valid,
+            "output": output_text.getvalue(),
+        }
+
+    def rpc_shutdown(self):
+        self.stopped.set()
+        return {"shutdown": True}
+
+    def close(self):
+        """Close every open session, removing its temporary directory."""
+        with self._lock:
+            while self.sessions:
+                _, doc = self.sessions.popitem()
+                doc.close()
+
+
+def _node_query(query):
+    """Turn JSON get_node() arguments into keyword arguments."""
+    if not isinstance(query, dict):
+        raise ServiceError(INVALID_PARAMS, "A node must be given as get_node() args")
+    query = dict(query)
+    line_number = query.get("line_number")
+    if isinstance(line_number, list):
+        query["line_number"] = range(*line_number)
+    return query
+
+
+def _node_result(node):
+    return {
+        "tag": node.tagName,
+        "line": getattr(node, "parse_position", (None,))[0],
+        "xml": node.toxml(),
+    }
+
+
+def _edit_result(result):
+    """Make an apply_edits() result JSON-serializable."""
+    if isinstance(result, (list, tuple)):
+        return [_edit_result(item) for item in result]
+    if hasattr(result, "toxml"):
+        return _node_result(result) if hasattr(result, "tagName") else None
+    return result
+
+
+def _error_response(request_id, code, message, data=None):
+    error = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "error": error})
+
+
+def serve_stdio(service, stdin=sys.stdin, stdout=sys.stdout):
+    """Answer requests on stdin until EOF or shutdown, then close all sessions."""
+    try:
+        for line in stdin:
+            if not line.strip():
+                continue
+            response = service.handle(line)
+            if response is not None:
+                stdout.write(response + "\n")
+                stdout.flush()
+            if service.stopped.is_set():
+                break
+    finally:
+        service.close()
+
+
+def serve_socket(service, path):
+    """Answer requests on a Unix socket until shutdown, then close all sessions."""
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                response = service.handle(line)
+                if response is not None:
+                    self.wfile.write(response.encode() + b"\n")
+                if service.stopped.is_set():
+                    threading.Thread(target=server.shutdown).start()
+                    return
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+    with Server(path, Handler) as server:
+        try:
+            server.serve_forever()
+        finally:
+            service.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+
+
+class ServiceClient:
+    """Minimal client for a service listening on a Unix socket."""
+
+    def __init__(self, path):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(str(path))
+        self._file = self._socket.makefile("rwb")
+        self._ids = itertools.count(1)
+
+    def call(self, method, **params):
+        """Call a method and return its result.
+
+        Raises:
+            RuntimeError: If the service returns an error
+        """
+        request = {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+            "params": params,
+        }
+        self._file.write(json.dumps(request).encode() + b"\n")
+        self._file.flush()
+        response = json.loads(self._file.readline())
+        if "error" in response:
+            error = response["error"]
+            output = (error.get("data") or {}).get("output", "")
+            raise RuntimeError(f"{error['message']}\n{output}".rstrip())
+        return response["result"]
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve Document sessions over JSON-RPC"
+    )
+    parser.add_argument(
+        "--socket", metavar="PATH", help="Listen on a Unix socket instead of stdio"
+    )
+    args = parser.parse_args()
+
+    service = DocumentService()
+    if args.socket:
+        serve_socket(service, args.socket)
+    else:
+        serve_stdio(service)
+
+
+if __name__ == "__main__":
+    main()
@@ -30,12 +30,20 @@ Example usage:
     editor.save()
 """
 
+import bisect
 import html
+import os
+import re
+import threading
+import xml.dom.minidom
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 
 
 class XMLEditor:
@@ -50,8 +58,37 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        dirty: True if saving would change the file
+
+    Lookups through get_node() are served from an index of tags, attribute
+    values and source lines that is built on first use, and contains= filters
+    read element text from a cache. Both are kept up to date by the editing
+    methods and by the DOM calls on the tree's elements (appendChild,
+    insertBefore, removeChild, replaceChild, setAttribute, removeAttribute),
+    which report direct changes to the editor; with LxmlXMLEditor, so do
+    lxml's own element methods (append, insert, extend, addnext, addprevious,
+    remove, replace, set). Changes made any other way, such as assigning
+    Text.data, an element's text or tag, or an item of its attrib, are only
+    seen after mark_dirty(); both are also dropped when dirty or
+    save_if_changed() detects such a change. Subclasses that restructure the
+    DOM with other calls should call _reindex() on the nodes they touched.
+
+    Changes made through the editor's methods are tracked. Once the tree has
+    been handed out (through dom, get_node() or nodes returned by an edit),
+    callers may change it directly, so dirty and save_if_changed() serialize
+    such an editor and compare it with the file; no bookkeeping is needed.
+    Editors that were only read through their own methods are never
+    serialized.
     """
 
+    # Methods apply_edits() may call, and whether each takes an "xml" fragment
+    EDIT_OPERATIONS = {
+        "replace_node": True,
+        "insert_after": True,
+        "insert_before": True,
+        "append_to": True,
+    }
+
     def __init__(self, xml_path):
         """
         Initialize with path to XML file and parse with line number tracking.
@@ -70,8 +107,26 @@ class XMLEditor:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
+        self._parse()
+        self._index = None
+        self._texts = {}  # element -> cached _get_element_text() result
+        self._prepared_fragments = {}  # xml_content -> parsed node lists
+        self._dirty = False  # Set by tracked edits
+        self._exposed = False  # Set once nodes are handed out for direct edits
+
+    @property
+    def dom(self):
+        """The parsed DOM tree; callers may change it directly."""
+        self._exposed = True
+        return self._dom
+
+    def _parse(self):
+        """Parse xml_path into self._dom, recording each element's position."""
         parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        # Elements report direct changes to this editor; see _TrackedElement
+        self._dom.__class__ = _TrackedDocument
+        self._dom._editor = self
 
     def get_node(
         self,
@@ -109,40 +164,49 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        normalized_contains = None
+        if contains is not None:
+            # Normalize the search string: convert HTML entities to Unicode characters
+            # This allows searching for both "&#8220;Rowan" and ""Rowan"
+            normalized_contains = html.unescape(contains)
+
+        candidates = self._node_index().candidates(tag, attrs, line_number)
+        if attrs:
+            # Compare attributes on the live elements; cheap on a small bucket
+            candidates = self._filter_attributes(candidates, attrs)
+        if normalized_contains is not None:
+            # Filter on cached text first; it is the cheapest and most selective
+            texts = self._texts
+            candidates = [
+                elem
+                for elem in candidates
+                if normalized_contains in (texts.get(elem) or self._cached_text(elem))
+            ]
+        matches = [
+            elem
+            for elem in candidates
+            if tag in ("*", elem.tagName)
+            and self._node_matches(elem, attrs, line_number, None)
+            and self._is_attached(elem)
+        ]
+        if normalized_contains is not None:
+            # Confirm text matches against the live DOM in case a text node was
+            # edited directly; only the (usually single) match is re-read
+            matches = [
+                elem
+                for elem in matches
+                if normalized_contains in self._get_element_text(elem)
+            ]
+        if not matches:
+            # The index and text cache only miss changes made behind the DOM
+            # calls; confirm with a full scan before reporting no match
+            matches = [
+                elem
+                for elem in self._dom.getElementsByTagName(tag)
+                if self._node_matches(elem, attrs, line_number, normalized_contains)
+            ]
+            if matches:
+                self._forget_lookups()
 
         if not matches:
             # Build descriptive error message
@@ -164,7 +228,7 @@ class XMLEditor:
 
             # Add helpful hint based on filters used
             if contains:
-                hint = "Text may be split across elements or use different wording."
+                hint = self._split_text_hint(tag, normalized_contains)
             elif line_number:
                 hint = "Line numbers may have changed if document was modified."
             elif attrs:
@@ -178,8 +242,158 @@ class XMLEditor:
                 f"Multiple nodes found: <{tag}>. "
                 f"Add more filters (attrs, line_number, or contains) to narrow the search."
             )
+        # The caller may now change the node directly
+        self._exposed = True
         return matches[0]
 
+    def _node_matches(self, elem, attrs, line_number, contains):
+        """Check an element against the get_node() filters."""
+        # Check line_number filter
+        if line_number is not None:
+            parse_pos = getattr(elem, "parse_position", (None,))
+            elem_line = parse_pos[0]
+
+            # Handle both single line number and range
+            if isinstance(line_number, range):
+                if elem_line not in line_number:
+                    return False
+            else:
+                if elem_line != line_number:
+                    return False
+
+        # Check attrs filter
+        if attrs is not None:
+            if not all(
+                elem.getAttribute(attr_name) == attr_value
+                for attr_name, attr_value in attrs.items()
+            ):
+                return False
+
+        # Check contains filter
+        if contains is not None:
+            if contains not in self._get_element_text(elem):
+                return False
+
+        return True
+
+    def _filter_attributes(self, elements, attrs):
+        """Return the elements whose attributes have the given values."""
+        for name, value in attrs.items():
+            elements = [elem for elem in elements if elem.getAttribute(name) == value]
+        return elements
+
+    def _is_attached(self, node):
+        """Check whether a node is still part of this editor's document."""
+        while node.parentNode is not None:
+            node = node.parentNode
+        return node is self._dom
+
+    def _node_index(self):
+        """Return the lookup index, building it on first use."""
+        if self._index is None:
+            self._index = _NodeIndex()
+            self._index.add(self._index_entries(self._dom.documentElement))
+        return self._index
+
+    def _reindex(self, nodes):
+        """Refresh index entries for the given nodes and their descendants.
+
+        Args:
+            nodes: DOM nodes that were inserted or whose tags or attributes changed
+        """
+        self._dirty = True
+        # Edits return these nodes, so the caller may change them directly later
+        self._exposed = True
+        for node in nodes:
+            self._forget_text(node)
+            if self._index is not None and node.nodeType == node.ELEMENT_NODE:
+                self._index.add(self._index_entries(node))
+
+    def _unindex(self, node):
+        """Drop index entries for a node that is being removed."""
+        self._dirty = True
+        if self._index is not None and node.nodeType == node.ELEMENT_NODE:
+            self._index.remove(self._subtree(node))
+
+    def _subtree(self, elem):
+        """Return elem followed by all of its descendant elements."""
+        return [elem, *elem.getElementsByTagName("*")]
+
+    def _index_entries(self, root):
+        """Yield an index entry for each element of a subtree."""
+        for elem in self._subtree(root):
+            yield self._index_entry(elem)
+
+    def _index_entry(self, elem):
+        """Return (element, tag, attribute items, source line) for an element."""
+        line = getattr(elem, "parse_position", (None,))[0]
+        return elem, elem.tagName, elem.attributes.items(), line
+
+    def _nodes_inserted(self, parent, nodes):
+        """Refile nodes inserted into parent through a DOM call."""
+        # Subtrees built before they are attached are filed when attached
+        if self._is_attached(parent):
+            self._reindex(nodes)
+
+    def _node_removed(self, parent, node):
+        """Drop a node removed from parent through a DOM call."""
+        self._unindex(node)
+        while parent is not None:
+            self._texts.pop(parent, None)
+            parent = parent.parentNode
+
+    def _attributes_changed(self, elem):
+        """Refile an element whose attributes were set through a DOM call."""
+        self._dirty = True
+        if self._index is not None and self._is_attached(elem):
+            self._index.add([self._index_entry(elem)])
+
+    def _forget_lookups(self):
+        """Drop the lookup index and text cache after an untracked change."""
+        self._index = None
+        self._texts = {}
+
+    def _cached_text(self, elem):
+        """Return _get_element_text(elem), reusing text of unchanged subtrees."""
+        text = self._texts.get(elem)
+        if text is None:
+            text_parts = []
+            for node in elem.childNodes:
+                if node.nodeType == node.TEXT_NODE:
+                    if node.data.strip():
+                        text_parts.append(node.data)
+                elif node.nodeType == node.ELEMENT_NODE:
+                    text_parts.append(self._cached_text(node))
+            text = self._texts[elem] = "".join(text_parts)
+        return text
+
+    def _forget_text(self, node):
+        """Drop cached text for a changed node, its descendants and its ancestors."""
+        if not self._texts:
+            return
+        if node.nodeType == node.ELEMENT_NODE:
+            for elem in self._subtree(node):
+                self._texts.pop(elem, None)
+        parent = node.parentNode
+        while parent is not None:
+            self._texts.pop(parent, None)
+            parent = parent.parentNode
+
+    def _split_text_hint(self, tag, contains):
+        """Explain a failed contains= lookup, pointing at the paragraph if any."""
+        hint = "Text may be split across elements or use different wording."
+        if tag == "w:p":
+            return hint
+        for para in self._node_index().candidates("w:p"):
+            if self._is_attached(para) and contains in self._cached_text(para):
+                line = getattr(para, "parse_position", (None,))[0]
+                where = f" at line {line}" if line is not None else ""
+                return (
+                    f"The text spans several elements inside <w:p>{where}; "
+                    'search with tag="w:p" instead.'
+                )
+        return hint
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -222,6 +436,8 @@ class XMLEditor:
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        self._unindex(elem)
+        self._reindex(nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -246,6 +462,7 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self._reindex(nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -266,6 +483,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._reindex(nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -285,12 +503,88 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self._reindex(nodes)
         return nodes
 
+    def apply_edits(self, edits):
+        """
+        Apply a sequence of edits in one pass.
+
+        Every target is looked up before anything changes, so line numbers
+        and attributes refer to the document as it was before the batch. All
+        XML fragments are then parsed together and the edits run in order.
+
+        Args:
+            edits: Iterable of dicts (for example loaded from a JSON edit
+                script) with keys:
+                - op: Editor method name, one of EDIT_OPERATIONS
+                - target: DOM element, or dict of get_node() arguments
+                  (a two-item list line_number is read as a range)
+                - xml: XML fragment, for operations that take one
+
+        Returns:
+            list: The return value of each edit, in order
+
+        Raises:
+            ValueError: If an operation is unknown or lacks its fragment, a
+                target cannot be found, or an earlier edit in the batch removed
+                a target from the document (edits before it stay applied)
+
+        Example:
+            editor.apply_edits([
+                {"op": "replace_node",
+                 "target": {"tag": "w:r", "contains": "old"},
+                 "xml": "<w:r><w:t>new</w:t></w:r>"},
+                {"op": "insert_after",
+                 "target": {"tag": "w:p", "line_number": 42},
+                 "xml": "<w:p><w:r><w:t>added</w:t></w:r></w:p>"},
+            ])
+        """
+        planned = []
+        for edit in edits:
+            op = edit.get("op")
+            if op not in self.EDIT_OPERATIONS:
+                raise ValueError(f"Unknown edit operation: {op!r}")
+            xml_content = edit.get("xml")
+            if self.EDIT_OPERATIONS[op] and xml_content is None:
+                raise ValueError(f"Edit operation {op!r} requires an xml fragment")
+            planned.append((op, self._edit_target(edit.get("target")), xml_content))
+
+        contents = [xml for op, target, xml in planned if self.EDIT_OPERATIONS[op]]
+        for content, nodes in zip(contents, self._parse_fragments(contents)):
+            self._prepared_fragments.setdefault(content, []).append(nodes)
+        try:
+            results = []
+            for index, (op, target, xml_content) in enumerate(planned):
+                if not self._is_attached(target):
+                    raise ValueError(
+                        f"Edit {index} ({op}): target <{target.tagName}> is no "
+                        "longer in the document; an earlier edit removed it"
+                    )
+                if self.EDIT_OPERATIONS[op]:
+                    results.append(getattr(self, op)(target, xml_content))
+                else:
+                    results.append(getattr(self, op)(target))
+            return results
+        finally:
+            self._prepared_fragments = {}
+
+    def _edit_target(self, target):
+        """Resolve an apply_edits() target to an element."""
+        if not isinstance(target, dict):
+            if target is None:
+                raise ValueError("Edit is missing a target")
+            return target
+        query = dict(target)
+        line_number = query.get("line_number")
+        if isinstance(line_number, (list, tuple)):
+            query["line_number"] = range(*line_number)
+        return self.get_node(**query)
+
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
+        for rel_elem in self._dom.getElementsByTagName("Relationship"):
             rel_id = rel_elem.getAttribute("Id")
             if rel_id.startswith("rId"):
                 try:
@@ -299,6 +593,22 @@ class XMLEditor:
                     pass
         return f"rId{max_id + 1}"
 
+    @property
+    def dirty(self):
+        """True if saving would change the file.
+
+        Tracked edits answer this at once, as does an editor whose tree was
+        never handed out. Otherwise the tree is serialized and compared with
+        the file, which catches changes made directly through the DOM.
+        """
+        if self._dirty:
+            return True
+        if not self._exposed or self._matches_file(self._serialize()):
+            return False
+        self._dirty = True
+        self._forget_lookups()
+        return True
+
     def save(self):
         """
         Save the edited XML back to the file.
@@ -306,13 +616,72 @@ class XMLEditor:
         Serializes the DOM tree and writes it back to the original file path,
         preserving the original encoding (ascii or utf-8).
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        _replace_file_bytes(self.xml_path, self._serialize())
+        self._dirty = False
+
+    def save_if_changed(self):
+        """Save the file if the tree may have changed since it was parsed or saved.
+
+        Editors without tracked edits whose tree was never handed out are
+        skipped without serializing them.
+
+        Returns:
+            bool: Whether the file was written
+        """
+        if not (self._dirty or self._exposed):
+            return False
+        content = self._serialize()
+        tracked, self._dirty = self._dirty, False
+        if self._matches_file(content):
+            return False
+        if not tracked:
+            self._forget_lookups()
+        _replace_file_bytes(self.xml_path, content)
+        return True
+
+    def mark_dirty(self):
+        """Record a change made directly through the DOM.
+
+        Not needed for saving, which detects direct changes itself; it lets
+        dirty answer without serializing the tree and makes the next get_node()
+        rebuild its index, so nodes added or changed directly are found.
+        """
+        self._dirty = True
+        self._forget_lookups()
+
+    def _serialize(self):
+        """Return the tree as file content in the original encoding."""
+        return self._dom.toxml(encoding=self.encoding)
+
+    def _matches_file(self, content):
+        """Check serialized content against the file, ignoring the declaration.
+
+        Declarations differ only in quoting and line breaks, so a file written
+        elsewhere (such as by unpack.py) still matches its unchanged tree.
+        """
+        return _strip_declaration(content) == _strip_declaration(
+            self.xml_path.read_bytes()
+        )
+
+    def _ensure_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is missing."""
+        root = self._dom.documentElement
+        if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+            root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+            self._dirty = True
+
+    def _first_text(self, elem):
+        """Return the text before an element's first child node, or None."""
+        if elem.firstChild and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE:
+            return elem.firstChild.data
+        return None
 
     def _parse_fragment(self, xml_content):
         """
         Parse XML fragment and return list of imported nodes.
 
+        Fragments already parsed by apply_edits() are served without parsing.
+
         Args:
             xml_content: String containing XML fragment
 
@@ -322,8 +691,30 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
+        prepared = self._prepared_fragments.get(xml_content)
+        if prepared:
+            return prepared.pop()
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, contents):
+        """Parse several XML fragments with a single parser run.
+
+        Each fragment is wrapped in its own element inside one document, so
+        the per-parse setup is paid once however many fragments there are.
+
+        Args:
+            contents: List of XML fragment strings
+
+        Returns:
+            List with the imported nodes of each fragment, in order
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        if not contents:
+            return []
         # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
+        root_elem = self._dom.documentElement
         namespaces = []
         if root_elem and root_elem.attributes:
             for i in range(root_elem.attributes.length):
@@ -332,16 +723,698 @@ class XMLEditor:
                     namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
 
         ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
+        wrapper = f"<root {ns_decl}>{_wrap_fragments(contents)}</root>"
         fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
+        results = []
+        for fragment in fragment_doc.documentElement.childNodes:  # type: ignore
+            nodes = [
+                self._dom.importNode(child, deep=True) for child in fragment.childNodes
+            ]
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            results.append(nodes)
+        return results
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by an lxml tree instead of minidom.
+
+    Parsing, lookups and serialization run in libxml2, which takes a fraction
+    of minidom's memory and time on large parts such as word/document.xml.
+    The public API is the same as XMLEditor's. Returned nodes are lxml
+    elements that also provide the minidom calls scripts commonly use on them
+    (tagName, parentNode, getAttribute, setAttribute, getElementsByTagName,
+    toxml, appendChild, ...). Whitespace-only text between elements is not
+    exposed as nodes, so inserted nodes lists contain elements only.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree.ElementTree
+        dom: Minimal minidom-style view of the tree (documentElement and
+            getElementsByTagName)
+    """
+
+    @property
+    def tree(self):
+        """The parsed lxml tree; callers may change it directly.
+
+        Child and attribute changes through element methods keep lookups up
+        to date; see XMLEditor.
+        """
+        self._exposed = True
+        return self._tree
+
+    def _parse(self):
+        """Parse xml_path with lxml; positions come from each element's sourceline."""
+        self._parser = lxml.etree.XMLParser(
+            resolve_entities=False, no_network=True, huge_tree=True
+        )
+        # lxml elements cannot hold Python state, so each editor gets its own
+        # element class that reports direct changes back to it
+        element_class = type(_LxmlElement.__name__, (_LxmlElement,), {"_editor": self})
+        self._parser.set_element_class_lookup(
+            lxml.etree.ElementDefaultClassLookup(
+                element=element_class, comment=_LxmlComment, pi=_LxmlPI
+            )
+        )
+        self._tree = lxml.etree.parse(str(self.xml_path), self._parser)
+        self._dom = _LxmlDocument(self._tree)
+        self._prefixes = None
+        self._nsmap = None  # Root namespace map; lxml builds a new dict per access
+
+    def replace_node(self, elem, new_content):
+        """Replace an element with new XML content; see XMLEditor.replace_node()."""
+        nodes = self._parse_fragment(new_content)
+        for node in nodes:
+            elem.addprevious(node)
+        nodes[-1].tail = (nodes[-1].tail or "") + (elem.tail or "")
+        elem.getparent().remove(elem)
+        self._unindex(elem)
+        self._reindex(nodes)
         return nodes
 
+    def insert_after(self, elem, xml_content):
+        """Insert XML content after an element; see XMLEditor.insert_after()."""
+        nodes = self._parse_fragment(xml_content)
+        for node in reversed(nodes):
+            elem.addnext(node)
+        self._reindex(nodes)
+        return nodes
+
+    def insert_before(self, elem, xml_content):
+        """Insert XML content before an element; see XMLEditor.insert_before()."""
+        nodes = self._parse_fragment(xml_content)
+        for node in nodes:
+            elem.addprevious(node)
+        self._reindex(nodes)
+        return nodes
+
+    def append_to(self, elem, xml_content):
+        """Append XML content to an element; see XMLEditor.append_to()."""
+        nodes = self._parse_fragment(xml_content)
+        elem.extend(nodes)
+        self._reindex(nodes)
+        return nodes
+
+    def _serialize(self):
+        """Return the tree as file content in the original encoding."""
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>'
+        content = lxml.etree.tostring(
+            self._tree, encoding=self.encoding, xml_declaration=False
+        )
+        return declaration.encode(self.encoding) + content
+
+    def _ensure_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is missing.
+
+        lxml cannot add declarations to an existing element, so the root is
+        rebuilt with the extended namespace map and its children moved over.
+        """
+        root = self._tree.getroot()
+        if self._nsmap is None:
+            self._nsmap = root.nsmap
+        if prefix in self._nsmap:
+            return
+        new_root = self._parser.makeelement(
+            root.tag, attrib=dict(root.attrib), nsmap={**root.nsmap, prefix: uri}
+        )
+        new_root.text = root.text
+        new_root.extend(list(root))
+        new_root.sourceline = root.sourceline
+        self._tree._setroot(new_root)
+        self._prefixes = None
+        self._nsmap = None
+        self._forget_lookups()
+        self._dirty = True
+
+    def _first_text(self, elem):
+        """Return the text before an element's first child node, or None."""
+        return elem.text
+
+    def _parse_fragments(self, contents):
+        """
+        Parse several XML fragments with a single parser run.
+
+        Args:
+            contents: List of XML fragment strings
+
+        Returns:
+            List with the top-level lxml nodes (elements, comments, processing
+            instructions) of each fragment, in order, ready to insert
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        if not contents:
+            return []
+        namespaces = [
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self._tree.getroot().nsmap.items()
+        ]
+        wrapper = f"<root {' '.join(namespaces)}>{_wrap_fragments(contents)}</root>"
+        results = []
+        for fragment in lxml.etree.fromstring(wrapper, self._parser):
+            nodes = list(fragment)
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            # Fragment line numbers are not positions in the original file
+            for elem in elements:
+                for descendant in elem.iter(lxml.etree.Element):
+                    descendant.sourceline = 0
+            results.append(nodes)
+        return results
+
+    def _filter_attributes(self, elements, attrs):
+        """Return the elements whose attributes have the given values.
+
+        Prefixes are resolved once against the root element, where OOXML parts
+        declare them, instead of against each element's namespace map.
+        """
+        root = self._tree.getroot()
+        for name, value in attrs.items():
+            key = _clark_name(root, name)
+            if key is None:
+                elements = [
+                    elem for elem in elements if elem.getAttribute(name) == value
+                ]
+            else:
+                elements = [elem for elem in elements if elem.get(key, "") == value]
+        return elements
+
+    def _is_attached(self, node):
+        """Check whether a node is still part of this editor's document."""
+        # A removed element keeps its lxml document, so getroottree() would
+        # still report the original root; walk the parents instead
+        while node.getparent() is not None:
+            node = node.getparent()
+        return node is self._tree.getroot()
+
+    def _subtree(self, elem):
+        """Return elem followed by all of its descendant elements."""
+        return list(elem.iter(lxml.etree.Element))
+
+    def _index_entry(self, elem):
+        """Return (element, tag, attribute items, source line) for an element."""
+        attributes = [
+            (self._qualify(elem, name), value) for name, value in elem.attrib.items()
+        ]
+        return elem, elem.tagName, attributes, elem.sourceline
+
+    def _qualify(self, elem, clark_name):
+        """Turn a {uri}local name into prefix:local using the root's prefixes."""
+        if not clark_name.startswith("{"):
+            return clark_name
+        if self._prefixes is None:
+            self._prefixes = {
+                uri: prefix
+                for prefix, uri in self._tree.getroot().nsmap.items()
+                if prefix
+            }
+            self._prefixes[XML_NAMESPACE] = "xml"
+        uri, local = clark_name[1:].split("}", 1)
+        prefix = self._prefixes.get(uri)
+        if prefix is None:
+            return _qualified_name(elem, clark_name)
+        return f"{prefix}:{local}"
+
+    def _cached_text(self, elem):
+        """Return _get_element_text(elem), reusing text of unchanged subtrees."""
+        text = self._texts.get(elem)
+        if text is None:
+            text_parts = [elem.text] if elem.text and elem.text.strip() else []
+            for child in elem:
+                if child.nodeType == child.ELEMENT_NODE:
+                    text_parts.append(self._cached_text(child))
+                if child.tail and child.tail.strip():
+                    text_parts.append(child.tail)
+            text = self._texts[elem] = "".join(text_parts)
+        return text
+
+    def _get_element_text(self, elem):
+        """Concatenate all non-whitespace text within an element."""
+        return "".join(text for text in elem.itertext() if text.strip())
+
+
+class IdAllocator:
+    """
+    Hands out unique integer IDs, such as w:id values, in O(1).
+
+    The allocator starts past the highest ID already in use and only moves
+    forward, so an ID is never handed out twice. Blocks of IDs can be
+    reserved for producers that build XML fragments on their own (threads or
+    subprocesses) and write the IDs into the fragments themselves. All
+    methods are thread-safe.
+
+    Example:
+        ids = IdAllocator(["0", "3", "7"])
+        ids.allocate()  # 8
+        block = ids.reserve(100)  # range(9, 109), for another producer
+        ids.allocate()  # 109
+    """
+
+    def __init__(self, existing=()):
+        """
+        Args:
+            existing: IDs already in use (ints or strings; non-numeric values
+                are ignored)
+        """
+        self._next = 0
+        self._lock = threading.Lock()
+        self.note_all(existing)
+
+    @property
+    def next_id(self):
+        """The ID the next allocate() call will return."""
+        return self._next
+
+    def allocate(self):
+        """Return a new unique ID."""
+        with self._lock:
+            value = self._next
+            self._next += 1
+            return value
+
+    def reserve(self, count):
+        """Reserve count consecutive IDs and return them as a range."""
+        if count < 0:
+            raise ValueError(f"Cannot reserve {count} IDs")
+        with self._lock:
+            block = range(self._next, self._next + count)
+            self._next += count
+            return block
+
+    def note(self, value):
+        """Record an ID that is in use, so it is never allocated."""
+        self.note_all((value,))
+
+    def note_all(self, values):
+        """Record several IDs that are in use."""
+        highest = -1
+        for value in values:
+            try:
+                highest = max(highest, int(value))
+            except (TypeError, ValueError):
+                pass
+        with self._lock:
+            self._next = max(self._next, highest + 1)
+
+
+class _TrackedElement(xml.dom.minidom.Element):
+    """minidom Element that reports direct changes to its document's editor.
+
+    Child and attribute changes made through the DOM calls are passed on, so
+    the editor can refile the nodes in its lookup index.
+    """
+
+    def appendChild(self, node):
+        added = _inserted_nodes(node)
+        result = super().appendChild(node)
+        editor = getattr(self.ownerDocument, "_editor", None)
+        if editor is not None:
+            editor._nodes_inserted(self, added)
+        return result
+
+    def insertBefore(self, newChild, refChild):
+        added = _inserted_nodes(newChild)
+        result = super().insertBefore(newChild, refChild)
+        editor = getattr(self.ownerDocument, "_editor", None)
+        if editor is not None:
+            editor._nodes_inserted(self, added)
+        return result
+
+    def removeChild(self, oldChild):
+        result = super().removeChild(oldChild)
+        editor = getattr(self.ownerDocument, "_editor", None)
+        if editor is not None:
+            editor._node_removed(self, oldChild)
+        return result
+
+    def replaceChild(self, newChild, oldChild):
+        added = _inserted_nodes(newChild)
+        result = super().replaceChild(newChild, oldChild)
+        editor = getattr(self.ownerDocument, "_editor", None)
+        if editor is not None:
+            editor._node_removed(self, oldChild)
+            editor._nodes_inserted(self, added)
+        return result
+
+    def setAttribute(self, attname, value):
+        super().setAttribute(attname, value)
+        self._attributes_changed()
+
+    def setAttributeNS(self, namespaceURI, qualifiedName, value):
+        super().setAttributeNS(namespaceURI, qualifiedName, value)
+        self._attributes_changed()
+
+    def setAttributeNode(self, attr):
+        result = super().setAttributeNode(attr)
+        self._attributes_changed()
+        return result
+
+    setAttributeNodeNS = setAttributeNode
+
+    def removeAttribute(self, name):
+        super().removeAttribute(name)
+        self._attributes_changed()
+
+    def removeAttributeNS(self, namespaceURI, localName):
+        super().removeAttributeNS(namespaceURI, localName)
+        self._attributes_changed()
+
+    def removeAttributeNode(self, node):
+        result = super().removeAttributeNode(node)
+        self._attributes_changed()
+        return result
+
+    removeAttributeNodeNS = removeAttributeNode
+
+    def _attributes_changed(self):
+        editor = getattr(self.ownerDocument, "_editor", None)
+        if editor is not None:
+            editor._attributes_changed(self)
+
+
+class _TrackedDocument(xml.dom.minidom.Document):
+    """minidom Document whose new elements (created, cloned or imported) are tracked."""
+
+    def createElement(self, tagName):
+        elem = super().createElement(tagName)
+        elem.__class__ = _TrackedElement
+        return elem
+
+    def createElementNS(self, namespaceURI, qualifiedName):
+        elem = super().createElementNS(namespaceURI, qualifiedName)
+        elem.__class__ = _TrackedElement
+        return elem
+
+
+def _inserted_nodes(node):
+    """Return the nodes a DOM insert of node adds: a fragment's children, or node."""
+    if node.nodeType == node.DOCUMENT_FRAGMENT_NODE:
+        return list(node.childNodes)
+    return [node]
+
+
+class _LxmlDocument:
+    """minidom Document stand-in exposing the parts of the API editors rely on."""
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    @property
+    def documentElement(self):
+        return self.tree.getroot()
+
+    def getElementsByTagName(self, name):
+        root = self.tree.getroot()
+        matches = root.getElementsByTagName(name)
+        if name == "*" or root.tag == _clark_name(root, name, element=True):
+            matches.insert(0, root)
+        return matches
+
+
+class _LxmlNode:
+    """Node type constants shared by the lxml node classes, as on minidom nodes."""
+
+    ELEMENT_NODE = 1
+    TEXT_NODE = 3
+    PROCESSING_INSTRUCTION_NODE = 7
+    COMMENT_NODE = 8
+
+    @property
+    def parentNode(self):
+        return self.getparent()
+
+
+class _LxmlElement(_LxmlNode, lxml.etree.ElementBase):
+    """lxml element that also answers the common minidom Element calls.
+
+    Qualified names such as "w:id" are resolved against the namespace
+    declarations in scope of the element. Changes made through the minidom
+    calls, or through lxml's own child and attribute methods, are reported to
+    the editor set as _editor on the element class.
+    """
+
+    nodeType = _LxmlNode.ELEMENT_NODE
+    _editor = None
+
+    def __bool__(self):
+        # minidom nodes are always truthy; lxml elements are falsy when empty
+        return True
+
+    @property
+    def tagName(self):
+        return _qualified_name(self, self.tag)
+
+    nodeName = tagName
+
+    @property
+    def parse_position(self):
+        return (self.sourceline, None)
+
+    def getAttribute(self, name):
+        key = _clark_name(self, name)
+        return self.get(key, "") if key else ""
+
+    def hasAttribute(self, name):
+        if name.startswith("xmlns:"):
+            return name[6:] in self.nsmap
+        key = _clark_name(self, name)
+        return key is not None and key in self.attrib
+
+    def setAttribute(self, name, value):
+        key = _clark_name(self, name)
+        if key is None:
+            raise ValueError(f"Namespace prefix of '{name}' is not declared")
+        self.set(key, value)
+
+    def removeAttribute(self, name):
+        key = _clark_name(self, name)
+        if key is not None:
+            self.attrib.pop(key, None)
+            if self._editor is not None:
+                self._editor._attributes_changed(self)
+
+    def getElementsByTagName(self, name):
+        if name == "*":
+            return list(self.iterdescendants(lxml.etree.Element))
+        tag = _clark_name(self, name, element=True)
+        return list(self.iterdescendants(tag)) if tag else []
+
+    def appendChild(self, node):
+        self.append(node)
+        return node
+
+    def insertBefore(self, node, ref):
+        if ref is None:
+            self.append(node)
+        else:
+            ref.addprevious(node)
+        return node
+
+    def removeChild(self, node):
+        self.remove(node)
+        return node
+
+    def replaceChild(self, node, old):
+        old.addprevious(node)
+        self.remove(old)
+        return old
+
+    # lxml's own mutators, reported like the minidom calls above
+
+    def set(self, key, value):
+        super().set(key, value)
+        if self._editor is not None:
+            self._editor._attributes_changed(self)
+
+    def append(self, element):
+        super().append(element)
+        if self._editor is not None:
+            self._editor._nodes_inserted(self, [element])
+
+    def insert(self, index, element):
+        super().insert(index, element)
+        if self._editor is not None:
+            self._editor._nodes_inserted(self, [element])
+
+    def extend(self, elements):
+        elements = list(elements)
+        super().extend(elements)
+        if self._editor is not None:
+            self._editor._nodes_inserted(self, elements)
+
+    def addnext(self, element):
+        super().addnext(element)
+        parent = self.getparent()
+        if self._editor is not None and parent is not None:
+            self._editor._nodes_inserted(parent, [element])
+
+    def addprevious(self, element):
+        super().addprevious(element)
+        parent = self.getparent()
+        if self._editor is not None and parent is not None:
+            self._editor._nodes_inserted(parent, [element])
+
+    def remove(self, element):
+        super().remove(element)
+        if self._editor is not None:
+            self._editor._node_removed(self, element)
+
+    def replace(self, old_element, new_element):
+        super().replace(old_element, new_element)
+        if self._editor is not None:
+            self._editor._node_removed(self, old_element)
+            self._editor._nodes_inserted(self, [new_element])
+
+    def toxml(self):
+        xml = lxml.etree.tostring(self, encoding="unicode", with_tail=False)
+        parent = self.getparent()
+        if parent is None:
+            return xml
+        # Like minidom, leave out declarations inherited from ancestors
+        inherited = parent.nsmap
+        end = xml.index(">")
+        start_tag = re.sub(
+            r' xmlns(?::([\w.-]+))?="([^"]*)"',
+            lambda m: "" if inherited.get(m.group(1)) == m.group(2) else m.group(0),
+            xml[:end],
+        )
+        return start_tag + xml[end:]
+
+
+class _LxmlComment(_LxmlNode, lxml.etree.CommentBase):
+    nodeType = _LxmlNode.COMMENT_NODE
+
+
+class _LxmlPI(_LxmlNode, lxml.etree.PIBase):
+    nodeType = _LxmlNode.PROCESSING_INSTRUCTION_NODE
+
+
+def _wrap_fragments(contents):
+    """Concatenate XML fragments, each wrapped in its own element."""
+    return "".join(f"<fragment>{content}</fragment>" for content in contents)
+
+
+def _strip_declaration(content):
+    """Return XML bytes without the XML declaration and surrounding whitespace."""
+    content = content.strip()
+    if content.startswith(b"<?xml"):
+        content = content[content.index(b"?>") + 2 :].lstrip()
+    return content
+
+
+def _replace_file_bytes(path, content):
+    """Write content to a sibling file and move it over path.
+
+    The file is replaced rather than rewritten, so readers never see a
+    partly written part.
+    """
+    path = Path(path)
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_bytes(content)
+    os.replace(temp_path, path)
+
+
+def _qualified_name(elem, clark_name):
+    """Turn a {uri}local name into the prefix:local form in scope of elem."""
+    if not clark_name.startswith("{"):
+        return clark_name
+    uri, local = clark_name[1:].split("}", 1)
+    if uri == XML_NAMESPACE:
+        return f"xml:{local}"
+    if clark_name == elem.tag:
+        prefix = elem.prefix
+    else:
+        prefix = next(
+            (p for p, u in elem.nsmap.items() if u == uri and p is not None), None
+        )
+    return f"{prefix}:{local}" if prefix else local
+
+
+def _clark_name(elem, name, element=False):
+    """Resolve a prefix:local name in scope of elem, or None if undeclared.
+
+    Unprefixed element names are in the default namespace; unprefixed
+    attribute names are in no namespace.
+    """
+    if ":" not in name:
+        uri = elem.nsmap.get(None) if element else None
+        return f"{{{uri}}}{name}" if uri else name
+    prefix, local = name.split(":", 1)
+    uri = XML_NAMESPACE if prefix == "xml" else elem.nsmap.get(prefix)
+    return f"{{{uri}}}{local}" if uri else None
+
+
+class _NodeIndex:
+    """Maps tags, attribute values and source lines to the elements carrying them.
+
+    Buckets are insertion-ordered dicts used as sets, so entries can be added
+    and dropped in O(1). Every element remembers the keys it was filed under,
+    which lets a changed subtree be refiled without touching the rest of the
+    index. Candidates may be stale; get_node() re-checks every filter.
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        self.keys = {}  # element -> keys it is filed under
+        self.lines = []  # sorted source lines that have a bucket
+
+    def add(self, entries):
+        """File elements under their current keys, replacing any earlier entries.
+
+        Args:
+            entries: Iterable of (element, tag, attribute items, source line)
+        """
+        for elem, tag, attributes, line in entries:
+            self._discard(elem)
+            keys = [("tag", tag)]
+            for name, value in attributes:
+                keys.append(("attr", tag, name, value))
+            if line is not None:
+                keys.append(("line", line))
+                if ("line", line) not in self.buckets:
+                    bisect.insort(self.lines, line)
+            for key in keys:
+                self.buckets.setdefault(key, {})[elem] = None
+            self.keys[elem] = keys
+
+    def remove(self, elements):
+        """Drop elements from the index."""
+        for elem in elements:
+            self._discard(elem)
+
+    def _discard(self, elem):
+        for key in self.keys.pop(elem, ()):
+            self.buckets[key].pop(elem, None)
+
+    def candidates(self, tag, attrs=None, line_number=None):
+        """Return the smallest bucket of elements that may match the filters."""
+        options = [self.keys if tag == "*" else self.buckets.get(("tag", tag), {})]
+        if attrs and tag != "*":
+            options.extend(
+                self.buckets.get(("attr", tag, name, value), {})
+                for name, value in attrs.items()
+                # getAttribute() returns "" for a missing attribute, which the
+                # index cannot answer
+                if value
+            )
+        if isinstance(line_number, range) and line_number.step == 1:
+            start = bisect.bisect_left(self.lines, line_number.start)
+            stop = bisect.bisect_left(self.lines, line_number.stop)
+            options.append(
+                [
+                    elem
+                    for line in self.lines[start:stop]
+                    for elem in self.buckets[("line", line)]
+                ]
+            )
+        elif isinstance(line_number, int):
+            options.append(self.buckets.get(("line", line_number), {}))
+        return list(min(options, key=len))
+
 
 def _create_line_tracking_parser():
     """
@@ -349,7 +1422,8 @@ def _create_line_tracking_parser():
 
     Monkey patches the SAX content handler to store the current line and column
     position from the underlying expat parser onto each element as a parse_position
-    attribute (line, column) tuple.
+    attribute (line, column) tuple. Elements are made _TrackedElements, which
+    report direct changes once their document is given an editor.
 
     Returns:
         defusedxml.sax.xmlreader.XMLReader: Configured SAX parser
@@ -359,6 +1433,7 @@ def _create_line_tracking_parser():
         def startElementNS(name, tagName, attrs):
             orig_start_cb(name, tagName, attrs)
             cur_elem = dom_handler.elementStack[-1]
+            cur_elem.__class__ = _TrackedElement
             cur_elem.parse_position = (
                 parser._parser.CurrentLineNumber,  # type: ignore
                 parser._parser.CurrentColumnNumber,  # type: ignore
@@ -4,29 +4,77 @@ Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting
 
 Example usage:
     python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> --profile trace.json
+    python pack.py <input_directory> <office_file> --pool
+
+--pool validates on a pool of warm soffice instances (see soffice_pool.py)
+instead of a one-off soffice process. It is also on whenever
+OOXML_SOFFICE_WORKERS is set; a value of 0 turns it off again.
 """
 
 import argparse
-import shutil
+import io
+import os
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
+import xml.sax.handler
+import defusedxml.sax
 import zipfile
 from pathlib import Path
 
+try:
+    from .validation import profiling
+except ImportError:
+    from validation import profiling
+
+# Parts that are already compressed; storing them avoids a pointless deflate pass
+STORED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".tif",
+    ".tiff",
+    ".wdp",
+    ".jxr",
+    ".mp3",
+    ".m4a",
+    ".mp4",
+    ".m4v",
+    ".mov",
+    ".wmv",
+    ".avi",
+    ".zip",
+    ".docx",
+    ".pptx",
+    ".xlsx",
+}
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--pool",
+        action="store_true",
+        help="Validate on a pool of warm soffice instances "
+        "(default: on if OOXML_SOFFICE_WORKERS is set)",
+    )
+    profiling.add_arguments(parser)
     args = parser.parse_args()
+    use_pool = args.pool or "OOXML_SOFFICE_WORKERS" in os.environ
 
     try:
-        success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
-        )
+        with profiling.profile_to(args.profile, args.profile_format):
+            success = pack_document(
+                args.input_directory,
+                args.output_file,
+                validate=not args.force,
+                use_pool=use_pool,
+            )
 
         # Show warning if validation was skipped
         if args.force:
@@ -42,13 +90,15 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, use_pool=False):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        use_pool: Validate on the shared pool of warm soffice instances; see
+            validate_document() (default: False)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,34 +111,47 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    # Stream parts straight into the archive; the input directory is never modified
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        for f in input_dir.rglob("*"):
+            if not f.is_file():
+                continue
+            arcname = f.relative_to(input_dir).as_posix()
+            with profiling.span("pack_part", "part", part=arcname):
+                if f.name.endswith((".xml", ".rels")):
+                    # Remove pretty-printing whitespace on the fly, keeping the
+                    # file's timestamp as zf.write() does
+                    info = zipfile.ZipInfo.from_file(f, arcname)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with zf.open(info, "w") as dst:
+                        write_condensed_xml(f, dst)
+                elif f.suffix.lower() in STORED_EXTENSIONS:
+                    zf.write(f, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zf.write(f, arcname)
+            profiling.count("bytes_packed", f.stat().st_size)
+
+    # Validate if requested
+    if validate:
+        with profiling.span("soffice", "stage"):
+            valid = validate_document(output_file, use_pool=use_pool)
+        if not valid:
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
-def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+def validate_document(doc_path, use_pool=False):
+    """Validate document by converting to HTML with soffice.
+
+    The conversion runs in a one-off soffice process. With use_pool, it runs
+    on the shared pool of warm soffice instances instead when the LibreOffice
+    Python bridge is installed; starting the pool only pays off in long-lived
+    processes that validate many documents. If the pool fails for any reason
+    other than the conversion timing out, the one-off process is used.
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -99,6 +162,33 @@ def validate_document(doc_path):
             filter_name = "html:HTML (StarCalc)"
 
     with tempfile.TemporaryDirectory() as temp_dir:
+        pool = None
+        if use_pool:
+            try:
+                from .soffice_pool import shared_pool
+            except ImportError:
+                from soffice_pool import shared_pool
+            pool = shared_pool()
+        if pool is not None:
+            try:
+                pool.convert(
+                    doc_path,
+                    filter_name.split(":", 1)[1],
+                    Path(temp_dir) / f"{doc_path.stem}.html",
+                    timeout=10,
+                )
+                return True
+            except TimeoutError:
+                print("Validation error: Timeout during conversion", file=sys.stderr)
+                return False
+            except Exception as e:
+                # Bridge, startup or worker failures say nothing about the
+                # document; let a one-off soffice process decide
+                print(
+                    f"Warning: soffice pool failed ({e}), retrying in a new process",
+                    file=sys.stderr,
+                )
+
         try:
             result = subprocess.run(
                 [
@@ -131,28 +221,197 @@ def validate_document(doc_path):
 
 
 def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    """Strip unnecessary whitespace and remove comments, rewriting the file."""
+    xml_file = Path(xml_file)
+    temp_file = xml_file.with_name(xml_file.name + ".tmp")
+    with open(temp_file, "wb") as f:
+        write_condensed_xml(xml_file, f)
+    os.replace(temp_file, xml_file)
+
+
+def write_condensed_xml(source, output):
+    """Stream XML from source to a binary output, dropping whitespace and comments.
+
+    Whitespace-only text and comments are removed from every element except
+    *:t elements, whose content is kept verbatim. The XML is streamed through
+    a SAX parser, so memory stays bounded regardless of file size.
+
+    Args:
+        source: Path or binary file object to read
+        output: Binary file object to write UTF-8 encoded XML to
+    """
+    _format_xml(source, output, encoding="UTF-8", condense=True)
+
+
+def write_pretty_xml(source, output):
+    """Stream XML from source to a binary output, indented by two spaces.
+
+    Output is ascii encoded, with non-ascii characters written as character
+    references, matching minidom's toprettyxml(indent="  ", encoding="ascii").
+
+    Args:
+        source: Path or binary file object to read
+        output: Binary file object to write to
+    """
+    _format_xml(source, output, encoding="ascii", addindent="  ", newl="\n")
+
+
+def _format_xml(source, output, encoding, addindent="", newl="", condense=False):
+    """Re-serialize XML event by event, byte-compatible with minidom's writexml()."""
+    writer = io.TextIOWrapper(
+        output, encoding=encoding, errors="xmlcharrefreplace", newline="\n"
+    )
+    handler = _XMLFormatter(writer, encoding, addindent, newl, condense)
+    parser = defusedxml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.setProperty(xml.sax.handler.property_lexical_handler, handler)
+    try:
+        parser.parse(str(source) if isinstance(source, Path) else source)
+        writer.flush()
+    finally:
+        writer.detach()
+
+
+class _Frame:
+    """Output state of an open element."""
+
+    __slots__ = ("tag", "indent", "children", "text", "strip")
+
+    def __init__(self, tag, indent, strip):
+        self.tag = tag
+        self.indent = indent
+        self.children = 0
+        self.text = None  # Leading (data, is_cdata) child, not yet written
+        self.strip = strip
+
+
+class _XMLFormatter(xml.sax.handler.ContentHandler, xml.sax.handler.LexicalHandler):
+    """SAX handler that writes each node as minidom's writexml() would.
+
+    minidom writes an element whose only child is a text node inline, so a
+    leading text child is held back until the next event shows whether it is
+    the only one. Nothing else is buffered.
+    """
+
+    def __init__(self, writer, encoding, addindent, newl, condense):
+        super().__init__()
+        self.writer = writer
+        self.encoding = encoding
+        self.addindent = addindent
+        self.newl = newl
+        self.condense = condense
+        self.stack = []
+        self.pending_text = []
+        self.in_cdata = False
+
+    def startDocument(self):
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>'
+        self.writer.write(declaration + self.newl)
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+        indent = self._begin_child()
+        self.writer.write(f"{indent}<{name}")
+        # minidom's parser records namespace declarations before the other
+        # attributes, each group in document order
+        items = attrs.items()
+        for attr_name, value in sorted(items, key=lambda item: not _is_xmlns(item[0])):
+            self.writer.write(f' {attr_name}="{_escape(value)}"')
+        strip = self.condense and not name.endswith(":t")
+        self.stack.append(_Frame(name, indent, strip))
+
+    def endElement(self, name):
+        self._flush_text()
+        frame = self.stack.pop()
+        if frame.children == 0:
+            self.writer.write(f"/>{self.newl}")
+        elif frame.text is not None:
+            inline = self._render(*frame.text, indent="", newl="")
+            self.writer.write(f">{inline}</{name}>{self.newl}")
+        else:
+            self.writer.write(f"{frame.indent}</{name}>{self.newl}")
+
+    def characters(self, content):
+        self.pending_text.append(content)
+
+    def ignorableWhitespace(self, whitespace):
+        self.pending_text.append(whitespace)
+
+    def startCDATA(self):
+        self._flush_text()
+        self.in_cdata = True
+
+    def endCDATA(self):
+        self._flush_text()
+        self.in_cdata = False
+
+    def comment(self, content):
+        self._flush_text()
+        if self.stack and self.stack[-1].strip:
+            return
+        indent = self._begin_child()
+        self.writer.write(f"{indent}<!--{content}-->{self.newl}")
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        indent = self._begin_child()
+        self.writer.write(f"{indent}<?{target} {data}?>{self.newl}")
+
+    def _flush_text(self):
+        """Emit buffered character data as a single text node."""
+        if not self.pending_text:
+            return
+        data = "".join(self.pending_text)
+        self.pending_text = []
+
+        # minidom keeps no text outside the document element
+        if not self.stack:
+            return
+        frame = self.stack[-1]
+        if frame.strip and not self.in_cdata and data.strip() == "":
+            return
+        if frame.children == 0:
+            frame.children = 1
+            frame.text = (data, self.in_cdata)
+            return
+        indent = self._begin_child()
+        self.writer.write(self._render(data, self.in_cdata, indent, self.newl))
+
+    def _begin_child(self):
+        """Close the current start tag if needed and return the child indent."""
+        if not self.stack:
+            return ""
+        frame = self.stack[-1]
+        child_indent = frame.indent + self.addindent
+        if frame.children == 0:
+            self.writer.write(f">{self.newl}")
+        elif frame.text is not None:
+            self.writer.write(f">{self.newl}")
+            self.writer.write(self._render(*frame.text, child_indent, self.newl))
+            frame.text = None
+        frame.children += 1
+        return child_indent
+
+    @staticmethod
+    def _render(data, is_cdata, indent, newl):
+        """Serialize a text or CDATA node; CDATA ignores indentation."""
+        if is_cdata:
+            return f"<![CDATA[{data}]]>"
+        return _escape(f"{indent}{data}{newl}")
+
+
+def _is_xmlns(attr_name):
+    return attr_name == "xmlns" or attr_name.startswith("xmlns:")
+
+
+def _escape(data):
+    """Escape text and attribute values the way minidom does."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
 
 
 if __name__ == "__main__":
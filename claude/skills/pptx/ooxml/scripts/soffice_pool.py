@@ -0,0 +1,305 @@
+"""
+Pool of long-lived headless LibreOffice instances for document conversion.
+
+Starting soffice is most of the cost of a one-off `soffice --convert-to`. The
+pool keeps instances running, each with its own user profile and listening on
+a private UNO pipe, and hands them conversion jobs through a bounded queue.
+Each job has its own timeout. An instance is restarted after a set number of
+jobs, after a timeout, or when it crashes.
+
+Requires the LibreOffice Python bridge (the `uno` module, e.g. from the
+python3-uno package); shared_pool() returns None when it is unavailable so
+callers can fall back to a one-off soffice process.
+
+Example:
+    pool = SofficePool(workers=2)
+    try:
+        pool.convert("report.docx", "HTML", "/tmp/report.html", timeout=10)
+    finally:
+        pool.close()
+"""
+
+import atexit
+import concurrent.futures
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+    from com.sun.star.lang import DisposedException
+except ImportError:
+    uno = None
+
+# Instances started by shared_pool(); OOXML_SOFFICE_WORKERS overrides it and
+# 0 turns the shared pool off
+DEFAULT_WORKERS = 2
+
+
+class SofficePool:
+    """Warm headless LibreOffice instances serving conversion jobs.
+
+    Every worker thread owns one soffice instance, started on its first job.
+    Jobs wait in a queue of at most max_queue entries; submit() blocks while
+    it is full.
+
+    Args:
+        workers: Number of soffice instances
+        max_jobs: Jobs an instance serves before it is restarted
+        max_queue: Jobs that may wait for a free instance
+        job_timeout: Default seconds a conversion may take; the instance is
+            killed and restarted when it is exceeded
+        startup_timeout: Seconds to wait for a new instance to accept
+            connections
+
+    Raises:
+        RuntimeError: If the uno module or the soffice executable is missing
+    """
+
+    def __init__(
+        self,
+        workers=DEFAULT_WORKERS,
+        max_jobs=100,
+        max_queue=32,
+        job_timeout=10,
+        startup_timeout=30,
+    ):
+        if uno is None:
+            raise RuntimeError("The LibreOffice Python bridge (uno) is not available")
+        self.executable = shutil.which("soffice")
+        if self.executable is None:
+            raise RuntimeError("soffice not found")
+        self.max_jobs = max_jobs
+        self.job_timeout = job_timeout
+        self.startup_timeout = startup_timeout
+        self._jobs = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._serve, name=f"soffice-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, doc_path, filter_name, output_path, timeout=None):
+        """Queue a conversion and return a Future for its output path.
+
+        Args:
+            doc_path: Document to convert
+            filter_name: LibreOffice export filter, e.g. "HTML"
+            output_path: File to write
+            timeout: Seconds the conversion may take (default job_timeout)
+
+        Returns:
+            concurrent.futures.Future: Resolves to output_path, or raises the
+            conversion error (TimeoutError if the job timed out)
+        """
+        if self._closed:
+            raise RuntimeError("SofficePool is closed")
+        future = concurrent.futures.Future()
+        self._jobs.put(
+            (
+                Path(doc_path).resolve(),
+                filter_name,
+                Path(output_path).resolve(),
+                timeout or self.job_timeout,
+                future,
+            )
+        )
+        return future
+
+    def convert(self, doc_path, filter_name, output_path, timeout=None):
+        """Convert a document and wait for the result; see submit()."""
+        return self.submit(doc_path, filter_name, output_path, timeout).result()
+
+    def close(self):
+        """Finish queued jobs, then stop every soffice instance."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _serve(self):
+        instance = None
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                doc_path, filter_name, output_path, timeout, future = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if instance is None:
+                        instance = _SofficeInstance(
+                            self.executable, self.startup_timeout
+                        )
+                    instance.convert(doc_path, filter_name, output_path, timeout)
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(output_path)
+
+                # Recycle instances that crashed, timed out, or are worn out
+                if instance is not None and (
+                    not instance.alive or instance.jobs >= self.max_jobs
+                ):
+                    instance.close()
+                    instance = None
+        finally:
+            if instance is not None:
+                instance.close()
+
+
+class _SofficeInstance:
+    """One headless soffice process and its UNO connection."""
+
+    def __init__(self, executable, startup_timeout):
+        self.jobs = 0
+        self.desktop = None
+        self.profile_dir = tempfile.mkdtemp(prefix="soffice-profile-")
+        self.pipe_name = f"ooxml-soffice-{os.getpid()}-{id(self)}"
+        self.process = subprocess.Popen(
+            [
+                executable,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"-env:UserInstallation={Path(self.profile_dir).as_uri()}",
+                f"--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            self.desktop = self._connect(startup_timeout)
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def alive(self):
+        return self.process.poll() is None
+
+    def _connect(self, startup_timeout):
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        url = f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if not self.alive:
+                raise RuntimeError("soffice exited during startup")
+            try:
+                context = resolver.resolve(url)
+                break
+            except NoConnectException:
+                if time.monotonic() > deadline:
+                    # Not a TimeoutError, which is reserved for conversions
+                    raise RuntimeError(
+                        f"soffice did not start within {startup_timeout} seconds"
+                    )
+                time.sleep(0.1)
+        return context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def convert(self, doc_path, filter_name, output_path, timeout):
+        """Export a document with a filter, killing soffice if it takes too long."""
+        self.jobs += 1
+        timed_out = threading.Event()
+
+        def expire():
+            timed_out.set()
+            self.process.kill()
+
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.start()
+        try:
+            document = self.desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(str(doc_path)),
+                "_blank",
+                0,
+                (_property("Hidden", True),),
+            )
+            if document is None:
+                raise RuntimeError(f"soffice could not load {doc_path.name}")
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(str(output_path)),
+                    (_property("FilterName", filter_name),),
+                )
+            finally:
+                document.close(True)
+        except Exception as e:
+            if timed_out.is_set():
+                raise TimeoutError(
+                    f"Conversion took longer than {timeout} seconds"
+                ) from e
+            raise
+        finally:
+            watchdog.cancel()
+
+    def close(self):
+        """Stop soffice and remove its profile."""
+        if self.desktop is not None and self.alive:
+            try:
+                self.desktop.terminate()
+            except DisposedException:
+                # The bridge died with the instance; it is killed below
+                pass
+        if self.alive:
+            self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+def _property(name, value):
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_pool():
+    """Return the process-wide pool, or None if pooled conversion is unavailable.
+
+    The pool is created on first use and closed at interpreter exit. Its size
+    comes from OOXML_SOFFICE_WORKERS (default DEFAULT_WORKERS); 0 turns it off.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            workers = int(os.environ.get("OOXML_SOFFICE_WORKERS", DEFAULT_WORKERS))
+            if uno is None or workers < 1 or shutil.which("soffice") is None:
+                return None
+            _shared_pool = SofficePool(workers=workers)
+            atexit.register(_shared_pool.close)
+        return _shared_pool
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,67 @@
+"""
+Bounded in-process records of successful incremental validation runs.
+"""
+
+import collections
+import threading
+from pathlib import Path
+
+# Runs remembered per record. Each holds the hashes (and per-part facts) of
+# one package, so a long-lived process must not keep one for every package
+# it ever validated.
+MAX_RUNS = 64
+
+_records = []
+
+
+class RunRecord:
+    """Least recently used map from (unpacked dir, key) to the result of a run.
+
+    Args:
+        max_runs: Number of runs kept; the least recently used are dropped
+    """
+
+    def __init__(self, max_runs=MAX_RUNS):
+        self.max_runs = max_runs
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        _records.append(self)
+
+    def get(self, unpacked_dir, key):
+        """Return the value recorded for a run, or None."""
+        entry_key = (_dir_key(unpacked_dir), key)
+        with self._lock:
+            value = self._entries.get(entry_key)
+            if value is not None:
+                self._entries.move_to_end(entry_key)
+            return value
+
+    def put(self, unpacked_dir, key, value):
+        """Record a run, dropping the least recently used beyond max_runs."""
+        entry_key = (_dir_key(unpacked_dir), key)
+        with self._lock:
+            self._entries[entry_key] = value
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_runs:
+                self._entries.popitem(last=False)
+
+    def forget(self, unpacked_dir):
+        """Drop every run recorded for an unpacked directory or packed file."""
+        path = _dir_key(unpacked_dir)
+        with self._lock:
+            for entry_key in [k for k in self._entries if k[0] == path]:
+                del self._entries[entry_key]
+
+
+def forget_runs(unpacked_dir):
+    """Drop the runs every validator recorded for a directory or packed file.
+
+    Called when a directory goes away (such as a closed Document session),
+    so its entries do not wait to be evicted.
+    """
+    for record in _records:
+        record.forget(unpacked_dir)
+
+
+def _dir_key(path):
+    return str(Path(path).resolve())
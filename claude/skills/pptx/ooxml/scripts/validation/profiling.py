@@ -0,0 +1,238 @@
+"""
+Opt-in timing and profiling for the OOXML scripts.
+
+Nothing is recorded unless a Profiler is active, and the hooks cost a single
+check when it is not. validate.py and pack.py start one with --profile;
+library users such as Document sessions can call start()/stop() themselves
+or set OOXML_PROFILE to a file path to have a trace written at exit
+(OOXML_PROFILE_FORMAT picks the format, default json).
+
+Recorded data:
+- Spans: wall and CPU time of each check, each per-part step (parse, XSD
+  validation) and each pack or Document stage, with the part name
+- Counters: parsed parts, bytes read from packages, XSD cache hits, ...
+
+Output formats:
+- json: spans, counters and a per-span-name summary
+- chrome: Chrome trace-event format, for chrome://tracing or Perfetto
+- cprofile: cProfile statistics, for pstats or snakeviz
+
+Checks fanned out to worker processes (validate.py --jobs) are timed as a
+whole; their per-part spans stay in the workers.
+"""
+
+import atexit
+import contextlib
+import cProfile
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+FORMATS = ("json", "chrome", "cprofile")
+
+
+class Profiler:
+    """Spans and counters recorded during one run.
+
+    Args:
+        use_cprofile: Also run cProfile in the starting thread
+    """
+
+    def __init__(self, use_cprofile=False):
+        self.spans = []
+        self.counters = defaultdict(int)
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._cprofile = cProfile.Profile() if use_cprofile else None
+
+    @contextlib.contextmanager
+    def span(self, name, category, **args):
+        """Time the enclosed block as a span."""
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.thread_time() - cpu_start
+            with self._lock:
+                self.spans.append(
+                    {
+                        "name": name,
+                        "category": category,
+                        "start": start - self._origin,
+                        "wall": wall,
+                        "cpu": cpu,
+                        "thread": threading.get_ident(),
+                        "args": args,
+                    }
+                )
+
+    def count(self, name, amount=1):
+        """Add to a counter."""
+        with self._lock:
+            self.counters[name] += amount
+
+    def summary(self):
+        """Return {span name: {"calls", "wall", "cpu"}}, slowest first."""
+        totals = defaultdict(lambda: {"calls": 0, "wall": 0.0, "cpu": 0.0})
+        for span in self.spans:
+            total = totals[span["name"]]
+            total["calls"] += 1
+            total["wall"] += span["wall"]
+            total["cpu"] += span["cpu"]
+        return dict(sorted(totals.items(), key=lambda item: -item[1]["wall"]))
+
+    def to_json(self):
+        """Return the recorded data as a JSON-serializable dict."""
+        return {
+            "spans": self.spans,
+            "counters": dict(self.counters),
+            "summary": self.summary(),
+        }
+
+    def to_chrome_trace(self):
+        """Return the recorded data in Chrome trace-event format."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": span["start"] * 1e6,
+                "dur": span["wall"] * 1e6,
+                "pid": pid,
+                "tid": span["thread"],
+                "args": {**span["args"], "cpu_ms": span["cpu"] * 1e3},
+            }
+            for span in self.spans
+        ]
+        end = max((e["ts"] + e["dur"] for e in events), default=0)
+        events.extend(
+            {"name": name, "ph": "C", "ts": end, "pid": pid, "args": {name: value}}
+            for name, value in self.counters.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path, format="json"):
+        """Write the profile to a file in one of FORMATS."""
+        if format == "cprofile":
+            if self._cprofile is None:
+                raise ValueError("cProfile was not enabled for this profiler")
+            self._cprofile.dump_stats(path)
+            return
+        data = self.to_chrome_trace() if format == "chrome" else self.to_json()
+        with open(path, "w") as f:
+            json.dump(data, f, indent=1)
+
+
+# Profiler of the current run, or None when profiling is off
+_active = None
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+def start(use_cprofile=False):
+    """Start recording and return the new active Profiler."""
+    global _active
+    _active = Profiler(use_cprofile=use_cprofile)
+    if _active._cprofile is not None:
+        _active._cprofile.enable()
+    return _active
+
+
+def stop():
+    """Stop recording and return the Profiler that was active, if any."""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None and profiler._cprofile is not None:
+        profiler._cprofile.disable()
+    return profiler
+
+
+def span(name, category="stage", **args):
+    """Return a context manager timing a block, or a no-op when not profiling."""
+    if _active is None:
+        return _NO_SPAN
+    return _active.span(name, category, **args)
+
+
+def count(name, amount=1):
+    """Add to a counter when profiling."""
+    if _active is not None:
+        _active.count(name, amount)
+
+
+def timed(category="check"):
+    """Decorator recording each call of a method as a span named after it."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(func.__name__, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def add_arguments(parser):
+    """Add --profile and --profile-format options to an argparse parser."""
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write timing data for each check, part and stage to PATH",
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=FORMATS,
+        default="json",
+        help="Profile format: json trace, chrome trace events, or a cProfile "
+        "dump (default: json)",
+    )
+
+
+@contextlib.contextmanager
+def profile_to(path, format="json"):
+    """Profile the enclosed block and write the result to path.
+
+    A no-op if path is empty, so it can wrap a CLI's work unconditionally.
+    """
+    if not path:
+        yield
+        return
+    start(use_cprofile=format == "cprofile")
+    try:
+        yield
+    finally:
+        stop().save(path, format)
+        print(f"Profile written to {path}", file=sys.stderr)
+
+
+def _start_from_environment():
+    path = os.environ.get("OOXML_PROFILE")
+    # Worker processes inherit the variable but must not overwrite the trace
+    if not path or _active is not None or multiprocessing.parent_process():
+        return
+    format = os.environ.get("OOXML_PROFILE_FORMAT", "json")
+    start(use_cprofile=format == "cprofile")
+
+    def save():
+        profiler = stop()
+        if profiler is not None:
+            profiler.save(path, format)
+
+    atexit.register(save)
+
+
+_start_from_environment()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
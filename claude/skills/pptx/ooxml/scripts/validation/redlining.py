@@ -2,118 +2,158 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
-import zipfile
+import hashlib
+import io
+import xml.etree.ElementTree as ET
+from collections import deque
+from itertools import zip_longest
 from pathlib import Path
 
+from .memo import RunRecord
+from .package import ZipPackage, open_package
+from .textdiff import word_diff
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_docx,
+        verbose=False,
+        incremental=False,
+        author="Claude",
+    ):
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
-        self.namespaces = {
-            "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        }
+        self.incremental = incremental
+        self.author = author
+        self.namespaces = {"w": _W_NS}
+
+        # A packed document is read straight from its archive
+        self.package = (
+            ZipPackage(self.unpacked_dir) if self.unpacked_dir.is_file() else None
+        )
+
+    def close(self):
+        """Close the archive of a packed document, if one was opened."""
+        if self.package is not None:
+            self.package.close()
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
+        if self.package is not None:
+            found = "word/document.xml" in self.package
+        else:
+            found = modified_file.exists()
+        if not found:
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
+        if not self.incremental:
+            return self._validate_document(modified_file)
+
+        # Skip the comparison if document.xml is byte-identical to the last
+        # version that passed against this original
+        original = self.original_docx.resolve()
+        stat = original.stat()
+        key = (
+            str(self.unpacked_dir.resolve()),
+            str(original),
+            self.author,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+        with self._open_modified(modified_file) as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if _validated_documents.get(self.unpacked_dir, key) == digest:
+            if self.verbose:
+                print(
+                    "PASSED - document.xml unchanged since last successful validation"
+                )
+            return True
+
+        if not self._validate_document(modified_file):
+            return False
+        _validated_documents.put(self.unpacked_dir, key, digest)
+        return True
+
+    def _validate_document(self, modified_file):
+        """Compare document.xml with the original after removing Claude's changes."""
+
+        # Redlining validation is only needed if tracked changes by Claude have
+        # been used. If we can't parse the XML, continue with full validation.
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
+            with self._open_modified(modified_file) as f:
+                has_changes = self._has_author_changes(f)
+            if not has_changes:
                 if self.verbose:
                     print("PASSED - No tracked changes by Claude found.")
                 return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
+        except ET.ParseError:
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Read original document.xml from the shared original package
+        try:
+            original_content = open_package(self.original_docx).read(
+                "word/document.xml"
+            )
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
 
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
+        if original_content is None:
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
 
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+        # Stream the text of both documents with Claude's tracked changes
+        # removed and compare paragraph by paragraph, stopping at the first
+        # difference
+        modified_stream = self._open_modified(modified_file)
+        original_paragraphs = self._iter_paragraph_texts(io.BytesIO(original_content))
+        modified_paragraphs = self._iter_paragraph_texts(modified_stream)
+        try:
+            for original, modified in zip_longest(
+                original_paragraphs, modified_paragraphs
+            ):
+                if original != modified:
+                    break
+            else:
+                if self.verbose:
+                    print("PASSED - All changes by Claude are properly tracked")
+                return True
 
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+            # Paragraphs before the difference match and would not show in the
+            # diff, so only the rest of each document is read and compared
+            original_text = "\n".join(
+                [p for p in (original,) if p is not None] + list(original_paragraphs)
+            )
+            modified_text = "\n".join(
+                [p for p in (modified,) if p is not None] + list(modified_paragraphs)
+            )
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        finally:
+            modified_stream.close()
+
+        # Show detailed character-level differences for each paragraph,
+        # printed as they are computed
+        for line in self._iter_detailed_diff(original_text, modified_text):
+            print(line)
+        return False
 
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
-        error_parts = [
+        """Generate detailed word-level differences as a single message."""
+        return "\n".join(self._iter_detailed_diff(original_text, modified_text))
+
+    def _iter_detailed_diff(self, original_text, modified_text):
+        """Yield the failure message line by line, ending with the word diff."""
+        yield from [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
             "Likely causes:",
@@ -125,154 +165,102 @@ class RedliningValidator:
             "  - To reject another's INSERTION: Nest <w:del> inside their <w:ins>",
             "  - To restore another's DELETION: Add new <w:ins> AFTER their <w:del>",
             "",
+            "Differences:",
+            "============",
         ]
+        yield from word_diff(original_text, modified_text)
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
-        else:
-            error_parts.append("Unable to generate word diff (git not available)")
+    def _open_modified(self, modified_file):
+        """Open the modified document.xml, from the archive if it is packed."""
+        if self.package is not None:
+            return self.package.open("word/document.xml")
+        return open(modified_file, "rb")
 
-        return "\n".join(error_parts)
+    def _has_author_changes(self, source):
+        """Return True if the document has a w:ins or w:del by the author.
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+        Parsing stops at the first match.
+        """
+        for _, elem in ET.iterparse(source, events=("start",)):
+            if elem.tag in (_INS, _DEL) and elem.get(_AUTHOR) == self.author:
+                return True
+        return False
 
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+    def _iter_paragraph_texts(self, source):
+        """Yield paragraph text as it was before the author's tracked changes.
 
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
+        The document is parsed incrementally: the author's insertions are
+        skipped and text in their deletions is read as regular text. Text in
+        nested paragraphs (such as text boxes) also counts towards the
+        enclosing paragraph, and paragraphs are yielded in the order they
+        start. Empty paragraphs are skipped to avoid false positives when
+        tracked insertions add only structural elements without text content.
+
+        Args:
+            source: Path or binary file object of document.xml
+
+        Yields:
+            str: Non-empty paragraph text
 
-        return None
-
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
-
-        Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
+        Raises:
+            ET.ParseError: If the document is not well-formed
         """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+        skip_depth = 0  # Open w:ins elements inside an insertion by the author
+        deleted_depth = 0  # Open w:del elements by the author
+        open_paragraphs = []  # [text parts, ended] for each open w:p
+        pending = deque()  # Paragraphs not yet yielded, in start order
+
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if skip_depth:
+                    if tag == _INS:
+                        skip_depth += 1
+                elif tag == _INS and elem.get(_AUTHOR) == self.author:
+                    skip_depth = 1
+                elif tag == _DEL and elem.get(_AUTHOR) == self.author:
+                    deleted_depth += 1
+                elif tag == _P:
+                    paragraph = [[], False]
+                    open_paragraphs.append(paragraph)
+                    pending.append(paragraph)
+                continue
+
+            if skip_depth:
+                if tag == _INS:
+                    skip_depth -= 1
+                    if not skip_depth:
+                        elem.clear()
+            elif tag == _T or (tag == _DELTEXT and deleted_depth):
+                if elem.text:
+                    for parts, _ in open_paragraphs:
+                        parts.append(elem.text)
+            elif tag == _DEL and elem.get(_AUTHOR) == self.author:
+                deleted_depth -= 1
+            elif tag == _P:
+                open_paragraphs.pop()[1] = True
+                # A nested paragraph waits until the one enclosing it ends
+                while pending and pending[0][1]:
+                    text = "".join(pending.popleft()[0])
+                    if text:
+                        yield text
+                if not open_paragraphs:
+                    # The paragraph has been read; free its subtree
+                    elem.clear()
+
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_P = f"{{{_W_NS}}}p"
+_T = f"{{{_W_NS}}}t"
+_DELTEXT = f"{{{_W_NS}}}delText"
+_INS = f"{{{_W_NS}}}ins"
+_DEL = f"{{{_W_NS}}}del"
+_AUTHOR = f"{{{_W_NS}}}author"
+
+
+# SHA-256 of the last document.xml that passed, keyed by
+# (unpacked dir, original file, author, original size, original mtime)
+_validated_documents = RunRecord()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,222 @@
+"""
+In-process word and character diff used to report redlining failures.
+"""
+
+import re
+
+# Hunks longer than this (in characters) are compared word by word instead of
+# character by character, which keeps the diff fast on large rewrites
+MAX_CHARACTER_HUNK = 20000
+
+# Search steps one bisection may take before the region is reported as a
+# plain replacement; bounds the cost of diffing texts that barely match
+MAX_BISECT_WORK = 1_000_000
+
+_WORD_PATTERN = re.compile(r"\s+|[^\s]+")
+
+
+def word_diff(original_text, modified_text, max_character_hunk=MAX_CHARACTER_HUNK):
+    """Yield the differences between two texts as word-diff lines.
+
+    Uses the markup of `git diff --word-diff=plain`: removed text is wrapped
+    in [-...-] and added text in {+...+}, and only changed lines are shown.
+    Hunks are found by this module's own line diff, so which lines are shown
+    can differ from git's output. Lines are compared first, then each changed
+    hunk is compared character by character (word by word when the hunk is
+    larger than max_character_hunk). Lines are yielded hunk by hunk, so a
+    caller can print them without holding the whole report.
+
+    Args:
+        original_text: Text before the change, one paragraph per line
+        modified_text: Text after the change, one paragraph per line
+        max_character_hunk: Largest hunk, in characters, diffed per character
+
+    Yields:
+        str: Non-blank output lines
+    """
+    original_lines = original_text.split("\n")
+    modified_lines = modified_text.split("\n")
+    for old_lines, new_lines in _changed_hunks(original_lines, modified_lines):
+        old = "\n".join(old_lines)
+        new = "\n".join(new_lines)
+        if len(old) + len(new) > max_character_hunk:
+            old_tokens = _WORD_PATTERN.findall(old)
+            new_tokens = _WORD_PATTERN.findall(new)
+        else:
+            old_tokens = list(old)
+            new_tokens = list(new)
+        rendered = "".join(_render(_diff(old_tokens, new_tokens)))
+        for line in rendered.split("\n"):
+            if line.strip():
+                yield line
+
+
+def _changed_hunks(a, b):
+    """Yield (removed lines, added lines) for each run of changed lines."""
+    # Compare lines by identity of their text to keep the line diff cheap
+    ids = {}
+    a_ids = [ids.setdefault(line, len(ids)) for line in a]
+    b_ids = [ids.setdefault(line, len(ids)) for line in b]
+    old_lines, new_lines = [], []
+    i = j = 0
+    for op, a_part, b_part in _diff(a_ids, b_ids):
+        if op == "equal":
+            if old_lines or new_lines:
+                yield old_lines, new_lines
+                old_lines, new_lines = [], []
+        else:
+            old_lines.extend(a[i : i + len(a_part)])
+            new_lines.extend(b[j : j + len(b_part)])
+        i += len(a_part)
+        j += len(b_part)
+    if old_lines or new_lines:
+        yield old_lines, new_lines
+
+
+def _render(ops):
+    """Turn diff operations on characters or words into marked-up text."""
+    removed, added = [], []
+    for op, a_part, b_part in ops + [("equal", [], [])]:
+        if op != "equal":
+            removed.extend(a_part)
+            added.extend(b_part)
+            continue
+        if removed:
+            yield _mark("[-", "".join(removed), "-]")
+        if added:
+            yield _mark("{+", "".join(added), "+}")
+        removed, added = [], []
+        yield "".join(a_part)
+
+
+def _mark(opening, text, closing):
+    """Wrap each line of text in markers, leaving the line breaks outside."""
+    return "\n".join(
+        f"{opening}{part}{closing}" if part else "" for part in text.split("\n")
+    )
+
+
+def _diff(a, b):
+    """Return the operations turning sequence a into sequence b.
+
+    Each operation is ("equal", items, items), ("delete", items, []) or
+    ("insert", [], items), in order. Common prefixes and suffixes are peeled
+    off, then the rest is split with Myers' middle-snake bisection, which
+    needs memory linear in the input size.
+    """
+    ops = []
+    _diff_into(a, b, ops)
+    return ops
+
+
+def _diff_into(a, b, ops):
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and a[-suffix - 1] == b[-suffix - 1]:
+        suffix += 1
+
+    if prefix:
+        ops.append(("equal", a[:prefix], b[:prefix]))
+    a_mid = a[prefix : len(a) - suffix]
+    b_mid = b[prefix : len(b) - suffix]
+    split = None
+    if a_mid and b_mid and not set(a_mid).isdisjoint(b_mid):
+        split = _bisect(a_mid, b_mid)
+    if split:
+        x, y = split
+        _diff_into(a_mid[:x], b_mid[:y], ops)
+        _diff_into(a_mid[x:], b_mid[y:], ops)
+    else:
+        # Nothing in common: a plain replacement
+        if a_mid:
+            ops.append(("delete", a_mid, []))
+        if b_mid:
+            ops.append(("insert", [], b_mid))
+    if suffix:
+        ops.append(("equal", a[len(a) - suffix :], b[len(b) - suffix :]))
+
+
+def _bisect(a, b):
+    """Find the middle snake of the shortest edit script from a to b.
+
+    Returns the point (x, y) where the forward and backward searches meet;
+    diffing a[:x]/b[:y] and a[x:]/b[y:] separately gives an optimal diff.
+    Returns None if the sequences have nothing in common or the search
+    exceeds MAX_BISECT_WORK steps.
+    """
+    n, m = len(a), len(b)
+    max_d = (n + m + 1) // 2
+    offset = max_d
+    size = 2 * max_d + 2
+    forward = [-1] * size
+    backward = [-1] * size
+    forward[offset + 1] = 0
+    backward[offset + 1] = 0
+    delta = n - m
+    front = delta % 2 != 0
+    k1_start = k1_end = k2_start = k2_end = 0
+    work = 0
+    for d in range(max_d):
+        work += 2 * d + 2
+        if work > MAX_BISECT_WORK:
+            return None
+
+        # Walk forward from the start
+        for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+            k1_offset = offset + k1
+            if k1 == -d or (
+                k1 != d and forward[k1_offset - 1] < forward[k1_offset + 1]
+            ):
+                x1 = forward[k1_offset + 1]
+            else:
+                x1 = forward[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[x1] == b[y1]:
+                x1 += 1
+                y1 += 1
+            forward[k1_offset] = x1
+            if x1 > n:
+                k1_end += 2
+            elif y1 > m:
+                k1_start += 2
+            elif front:
+                k2_offset = offset + delta - k1
+                if 0 <= k2_offset < size and backward[k2_offset] != -1:
+                    if x1 >= n - backward[k2_offset]:
+                        return x1, y1
+
+        # Walk backward from the end
+        for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+            k2_offset = offset + k2
+            if k2 == -d or (
+                k2 != d and backward[k2_offset - 1] < backward[k2_offset + 1]
+            ):
+                x2 = backward[k2_offset + 1]
+            else:
+                x2 = backward[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[-x2 - 1] == b[-y2 - 1]:
+                x2 += 1
+                y2 += 1
+            backward[k2_offset] = x2
+            if x2 > n:
+                k2_end += 2
+            elif y2 > m:
+                k2_start += 2
+            elif not front:
+                k1_offset = offset + delta - k2
+                if 0 <= k1_offset < size and forward[k1_offset] != -1:
+                    x1 = forward[k1_offset]
+                    y1 = offset + x1 - k1_offset
+                    if x1 >= n - x2:
+                        return x1, y1
+
+    return None
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")